@@ -44,6 +44,36 @@ HERO_STYLES = [
     "retro",
 ]
 
+# Categories and (lowercase) title keywords that mark a story as CMMC/compliance relevant
+CMMC_RELEVANT_CATEGORIES = frozenset(
+    {
+        "cmmc_program",
+        "nist_compliance",
+        "defense_industrial_base",
+    }
+)
+CMMC_RELEVANT_TITLE_KEYWORDS = (
+    "cmmc",
+    "nist",
+    "compliance",
+    "dfars",
+    "cui",
+    "fedramp",
+    "fisma",
+    "defense contract",
+    "dod",
+    "pentagon",
+    "defense industrial",
+    "contractor",
+    "c3pao",
+    "cyber-ab",
+    "800-171",
+    "800-172",
+    "federal contract",
+    "government contract",
+    "cleared",
+)
+
 
 @dataclass
 class BuildContext:
@@ -694,46 +724,14 @@ class WebsiteBuilder:
         Stories are considered relevant if they have a relevant category or
         contain relevant keywords in their title.
         """
-        # Relevant categories (in priority order conceptually)
-        relevant_categories = {
-            "cmmc_program",
-            "nist_compliance",
-            "defense_industrial_base",
-        }
-
         # Check category
         category = story.get("category", "").lower()
-        if category in relevant_categories:
+        if category in CMMC_RELEVANT_CATEGORIES:
             return True
 
         # Check title for relevant keywords
         title = story.get("title", "").lower()
-        relevant_keywords = [
-            "cmmc",
-            "nist",
-            "compliance",
-            "dfars",
-            "cui",
-            "fedramp",
-            "fisma",
-            "defense contract",
-            "dod",
-            "pentagon",
-            "defense industrial",
-            "contractor",
-            "c3pao",
-            "cyber-ab",
-            "800-171",
-            "800-172",
-            "federal contract",
-            "government contract",
-            "cleared",
-        ]
-        for keyword in relevant_keywords:
-            if keyword in title:
-                return True
-
-        return False
+        return any(keyword in title for keyword in CMMC_RELEVANT_TITLE_KEYWORDS)
 
     def _get_hero_story(self) -> Dict:
         """Get the hero story, prioritizing CMMC/compliance-related non-Reddit stories.
@@ -9,19 +9,26 @@ Focused sources:
 """
 
 import re
+import threading
 import time
 import json
 import base64
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
-import feedparser
+import lxml.html
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
 from config import (
     CMMC_CORE_KEYWORDS,
     CMMC_KEYWORDS,
@@ -31,13 +38,19 @@ from config import (
     DEDUP_SIMILARITY_THRESHOLD,
     DELAYS,
     DIB_KEYWORDS,
+    FEED_FETCH_WORKERS,
+    HTTP_FETCH_PER_HOST,
+    HTTP_POOL_CONNECTIONS,
     INSIDER_THREAT_KEYWORDS,
     INTELLIGENCE_KEYWORDS,
     LIMITS,
     NIST_KEYWORDS,
+    OG_IMAGE_FETCH_WORKERS,
+    PACED_FETCH_HOSTS,
     TIMEOUTS,
     setup_logging,
 )
+from feed_parsing import parse_feed_entries, parse_feed_entry_timestamp, parse_timestamp
 from source_catalog import (
     DEFAULT_BROWSER_UA,
     DOMAIN_FETCH_PROFILES,
@@ -51,6 +64,12 @@ from source_registry import (
     source_quality_multiplier,
 )
 
+# RapidFuzz (optional) speeds up fuzzy title matching during dedup
+try:
+    from rapidfuzz.fuzz import ratio as _fuzz_ratio
+except ImportError:
+    _fuzz_ratio = None
+
 # Import story validator for AI-powered validation
 try:
     from story_validator import StoryValidator
@@ -59,76 +78,200 @@ except ImportError:
 
 logger = setup_logging("collect_trends")
 
+# Patterns and word lists are built once at import rather than on every trend.
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_KEYWORD_WORD_RE = re.compile(r"\b[a-zA-Z]{4,}\b")
+_IMG_SRC_RE = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']', re.IGNORECASE)
+# Matched against raw bytes so page chunks can be scanned as they stream in
+_OG_IMAGE_RES = (
+    re.compile(rb'<meta[^>]+property=["\']og:image["\'][^>]+content=["\']([^"\']+)["\']', re.IGNORECASE),
+    re.compile(rb'<meta[^>]+content=["\']([^"\']+)["\'][^>]+property=["\']og:image', re.IGNORECASE),
+)
+_HEAD_END_RE = re.compile(rb"</head>", re.IGNORECASE)
+
+# Upper bound on bytes read from an article page while looking for og:image
+_OG_IMAGE_MAX_BYTES = 64 * 1024
+
+# Tracking pixels, icons and other tiny images
+_IMAGE_SKIP_PATTERNS = (
+    "pixel",
+    "tracking",
+    "beacon",
+    "1x1",
+    "spacer",
+    "blank",
+    "clear.gif",
+    "gravatar",
+    "avatar",
+    "icon",
+    "logo",
+    "badge",
+    "button",
+    "sprite",
+)
+# Hosts/paths that serve images even without a file extension
+_IMAGE_CDN_PATTERNS = (
+    "images.",
+    "img.",
+    "cdn.",
+    "media.",
+    "wp-content/uploads",
+    "cloudfront",
+    "amazonaws",
+    "imgix",
+    "arcpublishing",
+)
+_IMAGE_SKIP_RE = re.compile("|".join(map(re.escape, _IMAGE_SKIP_PATTERNS)))
+_IMAGE_CDN_RE = re.compile("|".join(map(re.escape, _IMAGE_CDN_PATTERNS)))
+_IMAGE_EXTENSION_RE = re.compile(r"\.(?:jpe?g|png|gif|webp)(?:\?|\Z)")
+
+_DEDUP_STOP_WORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "to",
+        "of",
+        "in",
+        "for",
+        "on",
+        "with",
+        "from",
+        "after",
+        "before",
+        "about",
+        "update",
+        "latest",
+        "news",
+        "today",
+    }
+)
 
-def _normalize_datetime(value: datetime) -> datetime:
-    """Normalize timezone-aware datetimes to naive UTC."""
-    if value.tzinfo:
-        return value.astimezone(timezone.utc).replace(tzinfo=None)
-    return value
+_GLOBAL_KEYWORD_STOP_WORDS = frozenset(
+    {
+        "this",
+        "that",
+        "with",
+        "from",
+        "have",
+        "been",
+        "will",
+        "what",
+        "when",
+        "where",
+        "their",
+        "there",
+        "about",
+    }
+)
 
+# CMMC_KEYWORDS is the union of every keyword group, so a single sweep over it
+# yields the matches for all groups; groups are then resolved by set intersection.
+_ALL_KEYWORDS_LC = tuple(dict.fromkeys(kw.lower() for kw in CMMC_KEYWORDS))
+_CMMC_CORE_KEYWORDS_LC = frozenset(kw.lower() for kw in CMMC_CORE_KEYWORDS)
+_NIST_KEYWORDS_LC = frozenset(kw.lower() for kw in NIST_KEYWORDS)
+_INTELLIGENCE_KEYWORDS_LC = frozenset(kw.lower() for kw in INTELLIGENCE_KEYWORDS)
+_INSIDER_THREAT_KEYWORDS_LC = frozenset(kw.lower() for kw in INSIDER_THREAT_KEYWORDS)
+_DIB_KEYWORDS_LC = frozenset(kw.lower() for kw in DIB_KEYWORDS)
+
+# Keyword groups in category priority order; stories matching none are federal_cybersecurity
+_CATEGORY_KEYWORD_GROUPS = (
+    ("cmmc_program", _CMMC_CORE_KEYWORDS_LC),
+    ("nist_compliance", _NIST_KEYWORDS_LC),
+    ("intelligence_threats", _INTELLIGENCE_KEYWORDS_LC),
+    ("insider_threats", _INSIDER_THREAT_KEYWORDS_LC),
+    ("defense_industrial_base", _DIB_KEYWORDS_LC),
+)
+_FALLBACK_CATEGORY_RANK = len(_CATEGORY_KEYWORD_GROUPS)
+# Keyword -> rank of the highest-priority group containing it (built in reverse so higher priority wins)
+_KEYWORD_CATEGORY_RANK = {
+    kw: rank for rank, (_category, keywords) in reversed(list(enumerate(_CATEGORY_KEYWORD_GROUPS))) for kw in keywords
+}
 
-def parse_timestamp(value: Any) -> Optional[datetime]:
-    """Best-effort timestamp parser for API and feed values."""
-    if value is None:
-        return None
 
-    if isinstance(value, datetime):
-        return _normalize_datetime(value)
+def _utc_now() -> datetime:
+    """Current time as naive UTC, the form parsed feed timestamps are stored in."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
-    if isinstance(value, (int, float)):
-        ts_value = float(value)
-        if ts_value > 10_000_000_000:
-            ts_value = ts_value / 1000.0
-        try:
-            return datetime.fromtimestamp(ts_value, tz=timezone.utc).replace(tzinfo=None)
-        except (ValueError, OverflowError, OSError):
-            return None
 
-    if isinstance(value, str):
-        cleaned = value.strip()
-        if not cleaned:
-            return None
+def _match_keywords(content: str) -> FrozenSet[str]:
+    """Return every lowercased keyword contained in already-lowercased content."""
+    return frozenset(kw for kw in _ALL_KEYWORDS_LC if kw in content)
 
-        normalized = cleaned.replace("Z", "+00:00")
-        try:
-            return _normalize_datetime(datetime.fromisoformat(normalized))
-        except ValueError:
-            pass
 
-        try:
-            from email.utils import parsedate_to_datetime
+def _category_from_matches(matched: FrozenSet[str]) -> str:
+    """Pick the highest-priority category whose keywords appear in ``matched``."""
+    rank = min(
+        (_KEYWORD_CATEGORY_RANK.get(kw, _FALLBACK_CATEGORY_RANK) for kw in matched),
+        default=_FALLBACK_CATEGORY_RANK,
+    )
+    if rank == _FALLBACK_CATEGORY_RANK:
+        return "federal_cybersecurity"
+    return _CATEGORY_KEYWORD_GROUPS[rank][0]
 
-            return _normalize_datetime(parsedate_to_datetime(cleaned))
-        except (TypeError, ValueError):
-            pass
 
-        for fmt in ("%Y-%m-%d", "%Y/%m/%d"):
-            try:
-                return datetime.strptime(cleaned, fmt)
-            except ValueError:
-                continue
+def _score_from_matches(matched: FrozenSet[str]) -> float:
+    """Relevance score from core CMMC and NIST keyword hits."""
+    score = 1.0
 
-    return None
+    # Boost for core CMMC keywords
+    score += len(matched & _CMMC_CORE_KEYWORDS_LC) * 0.3
 
+    # Boost for NIST keywords
+    score += len(matched & _NIST_KEYWORDS_LC) * 0.2
 
-def parse_feed_entry_timestamp(entry: Any) -> Optional[datetime]:
-    """Extract timestamp from feedparser entry."""
-    for parsed_key in ("published_parsed", "updated_parsed", "created_parsed"):
-        parsed_value = entry.get(parsed_key)
-        if parsed_value:
-            try:
-                return datetime(*parsed_value[:6])
-            except Exception:
-                continue
+    return min(score, 3.0)  # Cap at 3.0
+
+
+@lru_cache(maxsize=4096)
+def _validate_image_url(url: str) -> bool:
+    """Check if URL is a valid image URL; cached since feeds repeat the same CDN/og:image URLs."""
+    if not url:
+        return False
+
+    url_lower = url.lower()
+
+    # Skip tracking pixels and tiny images
+    if _IMAGE_SKIP_RE.search(url_lower):
+        return False
 
-    for key in ("published", "updated", "created", "dc_date", "pubDate"):
-        parsed = parse_timestamp(entry.get(key))
-        if parsed:
-            return parsed
-    return None
+    # Must be http(s) URL
+    if not url.startswith(("http://", "https://")):
+        return False
+
+    # Should have image extension or be from known image CDNs
+    return bool(_IMAGE_EXTENSION_RE.search(url_lower) or _IMAGE_CDN_RE.search(url_lower))
+
+
+class _SimilarityMatcher:
+    """Character-level similarity of candidates against a fixed reference title.
+
+    Uses RapidFuzz's C++ ratio when installed, otherwise difflib with the reference
+    as the indexed second sequence and cheap upper bounds checked before the full ratio.
+    """
+
+    def __init__(self, reference: str):
+        self.reference = reference
+        self._matcher = None if _fuzz_ratio is not None else SequenceMatcher(None, b=reference)
+
+    def at_least(self, other: str, threshold: float) -> bool:
+        if self._matcher is None:
+            cutoff = threshold * 100
+            return _fuzz_ratio(other, self.reference, score_cutoff=cutoff) >= cutoff
+
+        matcher = self._matcher
+        matcher.set_seq1(other)
+        return (
+            matcher.real_quick_ratio() >= threshold
+            and matcher.quick_ratio() >= threshold
+            and matcher.ratio() >= threshold
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Trend:
     """Represents a single trending topic."""
 
@@ -149,7 +292,7 @@ class Trend:
 
     def __post_init__(self):
         parsed_timestamp = parse_timestamp(self.timestamp)
-        self.timestamp = parsed_timestamp or datetime.now()
+        self.timestamp = parsed_timestamp or _utc_now()
 
         if not self.source_metadata:
             self.source_metadata = source_metadata_dict(self.source)
@@ -200,6 +343,13 @@ class TrendCollector:
         self.global_keywords: List[str] = []
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": DEFAULT_BROWSER_UA})
+        # Size pools for concurrent fetches so connections are reused rather than discarded
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=max(FEED_FETCH_WORKERS, OG_IMAGE_FETCH_WORKERS),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.default_timeout = float(TIMEOUTS.get("default", 15))
         self.feed_timeout = float(TIMEOUTS.get("rss_feed", self.default_timeout))
         self.request_delay = float(DELAYS.get("between_requests", 0.15))
@@ -209,6 +359,8 @@ class TrendCollector:
         self.feed_cooldown_seconds = 5 * 60
         self.feed_failure_threshold = 2
         self.feed_failures: Dict[str, Dict[str, float]] = {}
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
         self.feed_cache: Dict[str, Dict[str, Any]] = {}
         self.feed_cache_file = Path(DATA_DIR) / "feed_runtime_cache.json"
         self.persistent_feed_cache: Dict[str, Dict[str, Any]] = {}
@@ -235,13 +387,26 @@ class TrendCollector:
         if not self._persistent_cache_dirty:
             return
         try:
+            payload = {
+                scope: self._serializable_cache_entry(entry) for scope, entry in self.persistent_feed_cache.items()
+            }
             self.feed_cache_file.parent.mkdir(parents=True, exist_ok=True)
             with open(self.feed_cache_file, "w", encoding="utf-8") as f:
-                json.dump(self.persistent_feed_cache, f)
+                json.dump(payload, f)
             self._persistent_cache_dirty = False
         except Exception as exc:
             logger.debug(f"Failed to flush persistent feed cache: {exc}")
 
+    @staticmethod
+    def _serializable_cache_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Base64-encode raw feed bytes for JSON; entries loaded from disk are already encoded."""
+        content = entry.get("content")
+        if not isinstance(content, (bytes, bytearray)):
+            return entry
+        serializable = {key: value for key, value in entry.items() if key != "content"}
+        serializable["content_b64"] = base64.b64encode(content).decode("ascii")
+        return serializable
+
     def _resolve_domain_profile(self, url: str) -> Dict[str, Any]:
         hostname = urlparse(url).hostname or ""
         return dict(DOMAIN_FETCH_PROFILES.get(hostname, {}))
@@ -264,6 +429,26 @@ class TrendCollector:
             merged.update(headers)
         return merged
 
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Semaphore capping concurrent requests to a single host across feed and og:image fetches."""
+        hostname = urlparse(url).hostname or ""
+        with self._host_slots_lock:
+            slot = self._host_slots.get(hostname)
+            if slot is None:
+                limit = 1 if hostname in PACED_FETCH_HOSTS else HTTP_FETCH_PER_HOST
+                slot = self._host_slots[hostname] = threading.BoundedSemaphore(limit)
+            return slot
+
+    @contextmanager
+    def _host_request(self, url: str):
+        """Hold the host's slot for one request, spacing out requests to paced hosts like reddit.com."""
+        with self._host_slot(url):
+            try:
+                yield
+            finally:
+                if (urlparse(url).hostname or "") in PACED_FETCH_HOSTS:
+                    time.sleep(self.request_delay)
+
     def _feed_scope(self, source_key: Optional[str], url: str) -> str:
         return source_key or url
 
@@ -301,9 +486,10 @@ class TrendCollector:
             "status_code": response.status_code,
             "url": url,
         }
+        # Raw bytes are shared with the runtime cache; base64 encoding is deferred to flush
         self.persistent_feed_cache[scope] = {
             "timestamp": now,
-            "content_b64": base64.b64encode(content_bytes).decode("ascii"),
+            "content": content_bytes,
             "headers": headers,
             "status_code": response.status_code,
             "url": url,
@@ -362,6 +548,19 @@ class TrendCollector:
             return None
         return self._response_from_cached(persistent)
 
+    def _conditional_headers(self, scope: str, url: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from the persisted copy of a feed."""
+        cached = self.persistent_feed_cache.get(scope)
+        if not cached or cached.get("url") != url:
+            return {}
+        cached_headers = cached.get("headers") or {}
+        conditional: Dict[str, str] = {}
+        if cached_headers.get("etag"):
+            conditional["If-None-Match"] = cached_headers["etag"]
+        if cached_headers.get("last-modified"):
+            conditional["If-Modified-Since"] = cached_headers["last-modified"]
+        return conditional
+
     def _is_feed_response(self, response: requests.Response) -> bool:
         content_type = response.headers.get("content-type", "").lower()
         if "xml" in content_type or "rss" in content_type:
@@ -397,12 +596,26 @@ class TrendCollector:
         attempts = max(1, int(domain_profile.get("attempts") or 1))
         retry_delay = float(domain_profile.get("retry_delay") or 0.4)
         request_headers = self._resolve_headers(headers, headers_profile, domain_profile)
+        conditional_headers = self._conditional_headers(scope, url)
+        request_headers.update(conditional_headers)
 
         errors: List[str] = []
         for attempt in range(1, attempts + 1):
             try:
-                response = self.session.get(url, timeout=effective_timeout, headers=request_headers or None)
-                if response.status_code not in allowed_status:
+                with self._host_request(url):
+                    response = self.session.get(url, timeout=effective_timeout, headers=request_headers or None)
+                if response.status_code == 304 and conditional_headers:
+                    # Unchanged since the persisted copy; reuse its body and refresh its age
+                    cached = self._response_from_cached(self.persistent_feed_cache.get(scope, {}), url)
+                    if cached is not None:
+                        self._record_feed_success(scope)
+                        self._cache_feed_response(scope, cached, url)
+                        return cached
+                    errors.append("HTTP 304 without cached body")
+                    for key in conditional_headers:
+                        request_headers.pop(key, None)
+                    conditional_headers = {}
+                elif response.status_code not in allowed_status:
                     errors.append(f"HTTP {response.status_code}")
                 elif not self._is_feed_response(response):
                     content_type = response.headers.get("content-type", "").lower()
@@ -452,11 +665,8 @@ class TrendCollector:
         """
         logger.info("Collecting CMMC trends from all sources...")
 
-        # Collect from RSS feeds
-        self._collect_rss_feeds()
-
-        # Collect from Reddit
-        self._collect_reddit()
+        # Collect from RSS feeds and Reddit
+        self._collect_feeds()
 
         # Collect from LinkedIn
         self._collect_linkedin()
@@ -488,22 +698,23 @@ class TrendCollector:
 
         logger.info("Running AI-powered story validation...")
 
-        # Convert Trend objects to dicts for the validator
+        # Convert Trend objects to dicts for the validator, remembering which trend each dict came from
         trend_dicts = []
+        trends_by_dict: Dict[int, Trend] = {}
         for t in self.trends:
-            trend_dicts.append(
-                {
-                    "title": t.title,
-                    "description": t.description,
-                    "category": t.category,
-                    "source": t.source,
-                    "url": t.url,
-                    "timestamp": t.timestamp.isoformat() if t.timestamp else None,
-                    "score": t.score,
-                    "keywords": t.keywords,
-                    "image_url": t.image_url,
-                }
-            )
+            td = {
+                "title": t.title,
+                "description": t.description,
+                "category": t.category,
+                "source": t.source,
+                "url": t.url,
+                "timestamp": t.timestamp.isoformat() if t.timestamp else None,
+                "score": t.score,
+                "keywords": t.keywords,
+                "image_url": t.image_url,
+            }
+            trend_dicts.append(td)
+            trends_by_dict[id(td)] = t
 
         # Run validation
         validator = StoryValidator()
@@ -517,141 +728,146 @@ class TrendCollector:
             if len(rejected_dicts) > 5:
                 logger.info(f"  ... and {len(rejected_dicts) - 5} more")
 
-        # Convert back to Trend objects
+        # Keep the original Trend objects (and their corroboration data); only the category can change
         self.trends = []
         for td in valid_dicts:
-            timestamp = td.get("timestamp")
-            if isinstance(timestamp, str):
-                try:
-                    timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                except ValueError:
-                    try:
-                        timestamp = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
-                    except ValueError:
-                        timestamp = None
-
-            trend = Trend(
-                title=td.get("title", ""),
-                source=td.get("source", ""),
-                url=td.get("url"),
-                description=td.get("description"),
-                category=td.get("category", "federal_cybersecurity"),
-                score=td.get("score", 1.0),
-                keywords=td.get("keywords", []),
-                timestamp=timestamp,
-                image_url=td.get("image_url"),
-            )
+            trend = trends_by_dict.get(id(td))
+            if trend is not None:
+                trend.category = td.get("category", trend.category)
+            else:
+                trend = Trend(
+                    title=td.get("title", ""),
+                    source=td.get("source", ""),
+                    url=td.get("url"),
+                    description=td.get("description"),
+                    category=td.get("category", "federal_cybersecurity"),
+                    score=td.get("score", 1.0),
+                    keywords=td.get("keywords", []),
+                    timestamp=parse_timestamp(td.get("timestamp")),
+                    image_url=td.get("image_url"),
+                )
             self.trends.append(trend)
 
         logger.info(f"AI validation complete: {len(self.trends)} stories remaining")
 
-    def _collect_rss_feeds(self):
-        """Collect from CMMC-related RSS feeds."""
-        logger.info("Fetching from CMMC RSS feeds...")
-        count = 0
+    def _map_sources(
+        self,
+        jobs: List[Tuple[Callable[[SourceSpec], List[Trend]], SourceSpec]],
+    ) -> List[List[Trend]]:
+        """Run (collector, source) jobs concurrently, returning results in job order."""
+        if not jobs:
+            return []
+        workers = max(1, min(FEED_FETCH_WORKERS, len(jobs)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda job: job[0](job[1]), jobs))
+
+    def _collect_feeds(self):
+        """Collect from CMMC RSS feeds and subreddits in one concurrent wave."""
+        logger.info("Fetching from CMMC RSS feeds and Reddit communities...")
+        rss_sources = self._collector_sources("cmmc_rss")
+        reddit_sources = self._collector_sources("cmmc_reddit")
+
+        jobs = [(self._collect_rss_source, source) for source in rss_sources]
+        jobs += [(self._collect_reddit_source, source) for source in reddit_sources]
+        results = self._map_sources(jobs)
+
+        rss_count = 0
+        for trends in results[: len(rss_sources)]:
+            self.trends.extend(trends)
+            rss_count += len(trends)
+
+        reddit_count = 0
+        for trends in results[len(rss_sources) :]:
+            self.trends.extend(trends)
+            reddit_count += len(trends)
+
+        logger.info(f"  Found {rss_count} CMMC stories from RSS feeds")
+        logger.info(f"  Found {reddit_count} stories from Reddit")
+
+    def _collect_rss_source(self, source: SourceSpec) -> List[Trend]:
+        """Fetch and parse a single CMMC RSS feed into trends."""
+        trends: List[Trend] = []
+        try:
+            response = self._fetch_rss(
+                source.url,
+                timeout=source.timeout_seconds or self.feed_timeout,
+                source_key=source.source_key or source.key,
+                fallback_url=source.fallback_url,
+                headers_profile=source.headers_profile,
+            )
+            if not response:
+                return trends
+            for entry in parse_feed_entries(response.content, LIMITS.get("cmmc_rss", 20)):
+                title = entry.get("title", "").strip()
+                description = entry.get("summary", "") or entry.get("description", "")
 
-        for source in self._collector_sources("cmmc_rss"):
-            try:
-                response = self._fetch_rss(
-                    source.url,
-                    timeout=source.timeout_seconds or self.feed_timeout,
-                    source_key=source.source_key or source.key,
-                    fallback_url=source.fallback_url,
-                    headers_profile=source.headers_profile,
-                )
-                if not response:
+                if not title or len(title) < 10:
                     continue
-                feed = feedparser.parse(response.content)
-
-                for entry in feed.entries[: LIMITS.get("cmmc_rss", 20)]:
-                    title = entry.get("title", "").strip()
-                    description = entry.get("summary", "") or entry.get("description", "")
 
-                    if not title or len(title) < 10:
-                        continue
+                # Check if CMMC-related
+                is_cmmc, category, score = self._analyze(title, description)
 
-                    # Check if CMMC-related
-                    content = (title + " " + description).lower()
-                    is_cmmc = any(kw.lower() in content for kw in CMMC_KEYWORDS)
-
-                    if is_cmmc:
-                        trend = Trend(
+                if is_cmmc:
+                    trends.append(
+                        Trend(
                             title=title[:200],
                             source=source.source_key or source.key,
                             url=entry.get("link"),
                             description=self._clean_html(description),
-                            category=self._categorize_trend(title, description),
-                            score=self._calculate_score(title, description),
+                            category=category,
+                            score=score,
                             image_url=self._extract_image_from_entry(entry),
                             timestamp=parse_feed_entry_timestamp(entry),
                         )
-                        self.trends.append(trend)
-                        count += 1
-
-                time.sleep(self.request_delay)
+                    )
 
-            except Exception as e:
-                logger.warning(f"RSS feed {source.name} error: {e}")
-                continue
-
-        logger.info(f"  Found {count} CMMC stories from RSS feeds")
+        except Exception as e:
+            logger.warning(f"RSS feed {source.name} error: {e}")
 
-    def _collect_reddit(self):
-        """Collect from CMMC-related subreddits."""
-        logger.info("Fetching from CMMC Reddit communities...")
+        return trends
 
-        subreddits = self._collector_sources("cmmc_reddit")
+    def _collect_reddit_source(self, source: SourceSpec) -> List[Trend]:
+        """Fetch and parse a single subreddit feed into trends."""
+        trends: List[Trend] = []
+        try:
+            response = self._fetch_rss(
+                source.url,
+                timeout=source.timeout_seconds or self.feed_timeout,
+                source_key=source.source_key or source.key,
+                fallback_url=source.fallback_url,
+                headers_profile=source.headers_profile,
+            )
+            if not response:
+                return trends
+            for entry in parse_feed_entries(response.content, 15):
+                title = entry.get("title", "").strip()
+                description = entry.get("summary", "")
 
-        count = 0
-        for source in subreddits:
-            try:
-                response = self._fetch_rss(
-                    source.url,
-                    timeout=source.timeout_seconds or self.feed_timeout,
-                    source_key=source.source_key or source.key,
-                    fallback_url=source.fallback_url,
-                    headers_profile=source.headers_profile,
-                )
-                if not response:
+                if not title or len(title) < 10:
                     continue
-                feed = feedparser.parse(response.content)
-
-                for entry in feed.entries[:15]:
-                    title = entry.get("title", "").strip()
-                    description = entry.get("summary", "")
 
-                    if not title or len(title) < 10:
-                        continue
+                # For CMMC/NISTControls, include all; others need keyword match
+                is_cmmc, category, _score = self._analyze(title, description)
+                include_post = is_cmmc or source.key in ["cmmc_reddit_cmmc", "cmmc_reddit_nistcontrols"]
 
-                    # For CMMC/NISTControls, include all; others need keyword match
-                    include_post = False
-                    if source.key in ["cmmc_reddit_cmmc", "cmmc_reddit_nistcontrols"]:
-                        include_post = True
-                    else:
-                        content = (title + " " + description).lower()
-                        include_post = any(kw.lower() in content for kw in CMMC_KEYWORDS)
-
-                    if include_post:
-                        trend = Trend(
+                if include_post:
+                    trends.append(
+                        Trend(
                             title=title,
                             source=source.source_key or source.key,
                             url=entry.get("link"),
                             description=self._clean_html(description),
-                            category=self._categorize_trend(title, description),
+                            category=category,
                             score=1.4,
                             image_url=self._extract_image_from_entry(entry),
                             timestamp=parse_feed_entry_timestamp(entry),
                         )
-                        self.trends.append(trend)
-                        count += 1
-
-                time.sleep(self.request_delay)
+                    )
 
-            except Exception as e:
-                logger.warning(f"Reddit {source.name} error: {e}")
-                continue
+        except Exception as e:
+            logger.warning(f"Reddit {source.name} error: {e}")
 
-        logger.info(f"  Found {count} stories from Reddit")
+        return trends
 
     def _collect_linkedin(self):
         """Collect from LinkedIn influencers via Apify."""
@@ -690,6 +906,11 @@ class TrendCollector:
         except Exception as e:
             logger.warning(f"LinkedIn collection error: {e}")
 
+    def _analyze(self, title: str, description: str) -> Tuple[bool, str, float]:
+        """Match keywords once and derive (is_cmmc, category, score) for an entry."""
+        matched = _match_keywords((title + " " + description).lower())
+        return bool(matched), _category_from_matches(matched), _score_from_matches(matched)
+
     def _categorize_trend(self, title: str, description: str) -> str:
         """Categorize a trend based on keywords.
 
@@ -701,36 +922,11 @@ class TrendCollector:
         5. defense_industrial_base - DoD contractors, defense contracts
         6. federal_cybersecurity - General federal cyber news (fallback)
         """
-        content = (title + " " + description).lower()
-
-        # Check categories in priority order
-        if any(kw.lower() in content for kw in CMMC_CORE_KEYWORDS):
-            return "cmmc_program"
-        elif any(kw.lower() in content for kw in NIST_KEYWORDS):
-            return "nist_compliance"
-        elif any(kw.lower() in content for kw in INTELLIGENCE_KEYWORDS):
-            return "intelligence_threats"
-        elif any(kw.lower() in content for kw in INSIDER_THREAT_KEYWORDS):
-            return "insider_threats"
-        elif any(kw.lower() in content for kw in DIB_KEYWORDS):
-            return "defense_industrial_base"
-        else:
-            return "federal_cybersecurity"
+        return _category_from_matches(_match_keywords((title + " " + description).lower()))
 
     def _calculate_score(self, title: str, description: str) -> float:
         """Calculate relevance score based on keyword matches."""
-        content = (title + " " + description).lower()
-        score = 1.0
-
-        # Boost for core CMMC keywords
-        core_matches = sum(1 for kw in CMMC_CORE_KEYWORDS if kw.lower() in content)
-        score += core_matches * 0.3
-
-        # Boost for NIST keywords
-        nist_matches = sum(1 for kw in NIST_KEYWORDS if kw.lower() in content)
-        score += nist_matches * 0.2
-
-        return min(score, 3.0)  # Cap at 3.0
+        return _score_from_matches(_match_keywords((title + " " + description).lower()))
 
     def _clean_html(self, text: str) -> str:
         """Remove HTML tags from text and apply smart truncation."""
@@ -739,13 +935,12 @@ class TrendCollector:
 
         # Clean HTML if present
         if "<" in text:
-            soup = BeautifulSoup(text, "html.parser")
-            clean = soup.get_text(separator=" ").strip()
+            clean = self._html_to_text(text)
         else:
             clean = text.strip()
 
         # Normalize whitespace
-        clean = re.sub(r"\s+", " ", clean)
+        clean = _WHITESPACE_RE.sub(" ", clean)
 
         # Smart truncation at sentence boundaries (up to 1500 chars)
         max_length = 1500
@@ -767,6 +962,15 @@ class TrendCollector:
 
         return clean
 
+    def _html_to_text(self, html: str) -> str:
+        """Extract visible text from an HTML fragment using lxml's C parser."""
+        try:
+            doc = lxml.html.fragment_fromstring(html, create_parent="div")
+            etree.strip_elements(doc, "script", "style", with_tail=False)
+            return " ".join(doc.itertext()).strip()
+        except (etree.ParserError, ValueError):
+            return BeautifulSoup(html, "html.parser").get_text(separator=" ").strip()
+
     def _extract_image_from_entry(self, entry) -> Optional[str]:
         """Extract image URL from RSS entry.
 
@@ -778,31 +982,35 @@ class TrendCollector:
         5. Images embedded in summary HTML
         """
         # Check media_content
-        if hasattr(entry, "media_content") and entry.media_content:
-            for media in entry.media_content:
+        media_content = entry.get("media_content")
+        if media_content:
+            for media in media_content:
                 if media.get("medium") == "image" or media.get("type", "").startswith("image"):
                     url = media.get("url")
                     if url and self._is_valid_image_url(url):
                         return url
 
         # Check media_thumbnail
-        if hasattr(entry, "media_thumbnail") and entry.media_thumbnail:
-            for thumb in entry.media_thumbnail:
+        media_thumbnail = entry.get("media_thumbnail")
+        if media_thumbnail:
+            for thumb in media_thumbnail:
                 url = thumb.get("url")
                 if url and self._is_valid_image_url(url):
                     return url
 
         # Check enclosures
-        if hasattr(entry, "enclosures") and entry.enclosures:
-            for enc in entry.enclosures:
+        enclosures = entry.get("enclosures")
+        if enclosures:
+            for enc in enclosures:
                 if enc.get("type", "").startswith("image"):
                     url = enc.get("href") or enc.get("url")
                     if url and self._is_valid_image_url(url):
                         return url
 
         # Check content HTML for img tags
-        if hasattr(entry, "content") and entry.content:
-            content_html = entry.content[0].get("value", "")
+        content = entry.get("content")
+        if content:
+            content_html = content[0].get("value", "")
             img_url = self._extract_img_from_html(content_html)
             if img_url:
                 return img_url
@@ -821,64 +1029,16 @@ class TrendCollector:
         if not html or "<img" not in html:
             return None
 
-        # Use regex to find img src attributes
-        img_pattern = r'<img[^>]+src=["\']([^"\']+)["\']'
-        matches = re.findall(img_pattern, html, re.IGNORECASE)
-
-        for url in matches:
+        # Scan img src attributes lazily and stop at the first usable one
+        for match in _IMG_SRC_RE.finditer(html):
+            url = match.group(1)
             if self._is_valid_image_url(url):
                 return url
         return None
 
     def _is_valid_image_url(self, url: str) -> bool:
         """Check if URL is a valid image URL (not a tracking pixel or icon)."""
-        if not url:
-            return False
-
-        url_lower = url.lower()
-
-        # Skip tracking pixels and tiny images
-        skip_patterns = [
-            "pixel",
-            "tracking",
-            "beacon",
-            "1x1",
-            "spacer",
-            "blank",
-            "clear.gif",
-            "gravatar",
-            "avatar",
-            "icon",
-            "logo",
-            "badge",
-            "button",
-            "sprite",
-        ]
-        if any(p in url_lower for p in skip_patterns):
-            return False
-
-        # Must be http(s) URL
-        if not url.startswith(("http://", "https://")):
-            return False
-
-        # Should have image extension or be from known image CDNs
-        image_extensions = (".jpg", ".jpeg", ".png", ".gif", ".webp")
-        image_cdns = [
-            "images.",
-            "img.",
-            "cdn.",
-            "media.",
-            "wp-content/uploads",
-            "cloudfront",
-            "amazonaws",
-            "imgix",
-            "arcpublishing",
-        ]
-
-        has_extension = any(url_lower.endswith(ext) or f"{ext}?" in url_lower for ext in image_extensions)
-        from_cdn = any(cdn in url_lower for cdn in image_cdns)
-
-        return has_extension or from_cdn
+        return _validate_image_url(url)
 
     def _fetch_missing_images(self):
         """Fetch og:image from article pages for trends without images.
@@ -911,15 +1071,20 @@ class TrendCollector:
         logger.info(f"Fetching og:image for {len(trends_to_fetch)} articles...")
         fetched = 0
 
-        for trend in trends_to_fetch[:15]:  # Limit to 15 requests
+        def _fetch(trend: Trend) -> Optional[str]:
             try:
-                og_image = self._fetch_og_image(trend.url)
+                return self._fetch_og_image(trend.url)
+            except Exception as e:
+                logger.debug(f"Failed to fetch og:image for {trend.url}: {e}")
+                return None
+
+        batch = trends_to_fetch[:15]  # Limit to 15 requests
+        # Bounded pool keeps per-publisher concurrency low to avoid rate limiting
+        with ThreadPoolExecutor(max_workers=OG_IMAGE_FETCH_WORKERS) as executor:
+            for trend, og_image in zip(batch, executor.map(_fetch, batch)):
                 if og_image:
                     trend.image_url = og_image
                     fetched += 1
-                time.sleep(0.3)  # Rate limiting
-            except Exception as e:
-                logger.debug(f"Failed to fetch og:image for {trend.url}: {e}")
 
         if fetched:
             logger.info(f"  Fetched {fetched} og:images from article pages")
@@ -930,81 +1095,78 @@ class TrendCollector:
             return None
 
         try:
-            response = self.session.get(
-                url,
-                timeout=5,
-                headers={"User-Agent": "Mozilla/5.0 (compatible; CMMCWatch/1.0)"},
-            )
-            response.raise_for_status()
-
-            # Look for og:image meta tag
-            patterns = [
-                r'<meta[^>]+property=["\']og:image["\'][^>]+content=["\']([^"\']+)',
-                r'<meta[^>]+content=["\']([^"\']+)["\'][^>]+property=["\']og:image',
-            ]
-
-            for pattern in patterns:
-                match = re.search(pattern, response.text, re.IGNORECASE)
-                if match:
-                    img_url = match.group(1)
-                    if self._is_valid_image_url(img_url):
+            # og:image lives in <head>, so stream the page and stop there instead of downloading the body.
+            # Articles often share a publisher, so the per-host slot keeps the pool off any one site.
+            with (
+                self._host_request(url),
+                self.session.get(
+                    url,
+                    timeout=5,
+                    headers={"User-Agent": "Mozilla/5.0 (compatible; CMMCWatch/1.0)"},
+                    stream=True,
+                ) as response,
+            ):
+                response.raise_for_status()
+                encoding = response.encoding or "utf-8"
+                head = bytearray()
+                for chunk in response.iter_content(chunk_size=8192):
+                    # Back up a little so a tag split across chunks is still seen
+                    scan_from = max(0, len(head) - len("</head>"))
+                    head.extend(chunk)
+                    img_url = self._og_image_from_head(head, encoding)
+                    if img_url:
                         return img_url
+                    if len(head) >= _OG_IMAGE_MAX_BYTES or _HEAD_END_RE.search(head, scan_from):
+                        break
 
         except requests.RequestException:
             pass
 
         return None
 
+    def _og_image_from_head(self, head: bytes, encoding: str) -> Optional[str]:
+        """Return the first valid og:image URL in a partial page, if any."""
+        for pattern in _OG_IMAGE_RES:
+            for match in pattern.finditer(head):
+                img_url = match.group(1).decode(encoding, errors="ignore")
+                if self._is_valid_image_url(img_url):
+                    return img_url
+        return None
+
     def _deduplicate(self):
         """Cluster and deduplicate trends using token overlap + semantic similarity."""
         if not self.trends:
             return
 
-        stop_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "to",
-            "of",
-            "in",
-            "for",
-            "on",
-            "with",
-            "from",
-            "after",
-            "before",
-            "about",
-            "update",
-            "latest",
-            "news",
-            "today",
-        }
-
         normalized_titles: List[str] = []
         token_sets: List[Set[str]] = []
+        token_keys: List[str] = []
         inverted_index: Dict[str, List[int]] = {}
+        exact_index: Dict[str, List[int]] = {}
 
         for idx, trend in enumerate(self.trends):
-            normalized = re.sub(r"[^\w\s]", " ", (trend.title or "").lower())
-            normalized = re.sub(r"\s+", " ", normalized).strip()
+            normalized = _NON_WORD_RE.sub(" ", (trend.title or "").lower())
+            normalized = _WHITESPACE_RE.sub(" ", normalized).strip()
             tokens = {
                 token
                 for token in normalized.split()
-                if len(token) >= 3 and not token.isdigit() and token not in stop_words
+                if len(token) >= 3 and not token.isdigit() and token not in _DEDUP_STOP_WORDS
             }
             if not tokens:
                 tokens = {token for token in normalized.split() if token}
 
             normalized_titles.append(normalized)
             token_sets.append(tokens)
+            token_keys.append(" ".join(sorted(tokens)))
+            if normalized:
+                exact_index.setdefault(normalized, []).append(idx)
 
             for token in tokens:
                 inverted_index.setdefault(token, []).append(idx)
 
         clusters: List[List[int]] = []
         assigned = set()
+        jaccard_threshold = max(0.55, DEDUP_SIMILARITY_THRESHOLD - 0.25)
 
         for index, _trend in enumerate(self.trends):
             if index in assigned:
@@ -1012,8 +1174,16 @@ class TrendCollector:
 
             cluster = [index]
             assigned.add(index)
+
+            # Exact normalized-title reposts join the cluster without a similarity scan
+            for exact_idx in exact_index.get(normalized_titles[index], []):
+                if exact_idx > index and exact_idx not in assigned:
+                    cluster.append(exact_idx)
+                    assigned.add(exact_idx)
+
             tokens_i = token_sets[index]
-            normalized_i = normalized_titles[index]
+            title_matcher = _SimilarityMatcher(normalized_titles[index])
+            token_matcher = _SimilarityMatcher(token_keys[index])
 
             candidate_indices = set()
             for token in tokens_i:
@@ -1026,7 +1196,6 @@ class TrendCollector:
                     continue
 
                 tokens_j = token_sets[candidate_idx]
-                normalized_j = normalized_titles[candidate_idx]
 
                 if not tokens_i or not tokens_j:
                     overlap_ratio = 0.0
@@ -1036,19 +1205,14 @@ class TrendCollector:
                     overlap_ratio = intersection / max(1, min(len(tokens_i), len(tokens_j)))
                     jaccard = intersection / max(1, len(tokens_i | tokens_j))
 
-                semantic_ratio = SequenceMatcher(None, normalized_i, normalized_j).ratio()
-                token_semantic_ratio = SequenceMatcher(
-                    None,
-                    " ".join(sorted(tokens_i)),
-                    " ".join(sorted(tokens_j)),
-                ).ratio()
-
-                is_duplicate = (
-                    overlap_ratio >= DEDUP_SIMILARITY_THRESHOLD
-                    or jaccard >= max(0.55, DEDUP_SIMILARITY_THRESHOLD - 0.25)
-                    or semantic_ratio >= DEDUP_SEMANTIC_THRESHOLD
-                    or token_semantic_ratio >= DEDUP_SEMANTIC_THRESHOLD
-                )
+                # Cheap set measures first; character-level matching only when they are inconclusive
+                is_duplicate = overlap_ratio >= DEDUP_SIMILARITY_THRESHOLD or jaccard >= jaccard_threshold
+                if not is_duplicate:
+                    title_j = normalized_titles[candidate_idx]
+                    is_duplicate = title_matcher.at_least(title_j, DEDUP_SEMANTIC_THRESHOLD)
+                if not is_duplicate:
+                    token_key_j = token_keys[candidate_idx]
+                    is_duplicate = token_matcher.at_least(token_key_j, DEDUP_SEMANTIC_THRESHOLD)
                 if not is_duplicate:
                     continue
 
@@ -1090,7 +1254,7 @@ class TrendCollector:
         Recency boost ensures today's articles rank higher than older ones,
         even if older articles have slightly higher keyword relevance.
         """
-        now = datetime.now()
+        now = _utc_now()
 
         for trend in self.trends:
             recency_boost = 0.0
@@ -1131,31 +1295,15 @@ class TrendCollector:
 
     def _extract_global_keywords(self):
         """Extract global keywords from all trends."""
-        keyword_counts: Dict[str, int] = {}
+        keyword_counts: Counter = Counter()
 
         for trend in self.trends:
-            words = re.findall(r"\b[a-zA-Z]{4,}\b", trend.title.lower())
-            for word in words:
-                if word not in {
-                    "this",
-                    "that",
-                    "with",
-                    "from",
-                    "have",
-                    "been",
-                    "will",
-                    "what",
-                    "when",
-                    "where",
-                    "their",
-                    "there",
-                    "about",
-                }:
-                    keyword_counts[word] = keyword_counts.get(word, 0) + 1
-
-        # Sort by frequency
-        sorted_keywords = sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)
-        self.global_keywords = [kw for kw, _ in sorted_keywords[:100]]
+            keyword_counts.update(
+                word for word in _KEYWORD_WORD_RE.findall(trend.title.lower()) if word not in _GLOBAL_KEYWORD_STOP_WORDS
+            )
+
+        # Top 100 by frequency (ties keep first-seen order, as with a stable sort)
+        self.global_keywords = [kw for kw, _ in keyword_counts.most_common(100)]
 
         logger.info(f"Found {len(self.global_keywords)} global keywords")
 
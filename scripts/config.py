@@ -301,6 +301,27 @@ CMMC_KEYWORDS = list(
     )
 )
 
+# Single-word CMMC vocabulary used to tag keywords on short-form posts
+CMMC_TERMS = frozenset(
+    {
+        "cmmc",
+        "nist",
+        "dfars",
+        "c3pao",
+        "cui",
+        "fedramp",
+        "cybersecurity",
+        "compliance",
+        "dod",
+        "defense",
+        "certification",
+        "assessment",
+        "800-171",
+        "contractor",
+        "security",
+    }
+)
+
 # Quality gates
 MIN_TRENDS = 5  # Minimum trends required to build
 MIN_FRESH_RATIO = 0.5  # At least 50% of trends must be from past 24h
@@ -332,6 +353,23 @@ DELAYS = {
     "between_images": 0.3,
 }
 
+# Worker threads for concurrent RSS/Reddit fetching
+FEED_FETCH_WORKERS = 8
+
+# Concurrent requests per host, shared by feed fetches and og:image lookups
+# (subreddits all share reddit.com; article pages often share a publisher)
+HTTP_FETCH_PER_HOST = 2
+
+# Hosts serving several feeds that rate-limit bursts (unauthenticated Reddit RSS answers 429).
+# These get one request at a time, spaced by DELAYS["between_requests"].
+PACED_FETCH_HOSTS = frozenset({"reddit.com", "www.reddit.com", "old.reddit.com"})
+
+# Worker threads for og:image lookups on article pages (kept low to avoid publisher rate limits)
+OG_IMAGE_FETCH_WORKERS = 5
+
+# Host pools kept alive on the collector's HTTP session (feeds span ~20 hosts)
+HTTP_POOL_CONNECTIONS = 32
+
 # ============================================================================
 # IMAGE SETTINGS
 # ============================================================================
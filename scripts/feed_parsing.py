@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Feed Parsing - Shared RSS/Atom entry and timestamp helpers.
+
+Used by the trend collector and the standalone competitor monitor. Plain RSS 2.0
+is read with lxml; anything else falls back to feedparser. Entries expose the
+feedparser keys the collectors read (title, link, summary, published, ...).
+"""
+
+import html
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from itertools import islice
+from typing import Any, Dict, List, Optional
+
+import feedparser
+from lxml import etree
+
+# RSS extension elements read by the lxml fast path (media RSS is published with and without the slash)
+_MEDIA_NAMESPACES = ("http://search.yahoo.com/mrss/", "http://search.yahoo.com/mrss")
+_MEDIA_CONTENT_TAGS = tuple(f"{{{ns}}}content" for ns in _MEDIA_NAMESPACES)
+_MEDIA_THUMBNAIL_TAGS = tuple(f"{{{ns}}}thumbnail" for ns in _MEDIA_NAMESPACES)
+_CONTENT_ENCODED_TAG = "{http://purl.org/rss/1.0/modules/content/}encoded"
+_DC_DATE_TAG = "{http://purl.org/dc/elements/1.1/}date"
+
+
+def _normalize_datetime(value: datetime) -> datetime:
+    """Normalize timezone-aware datetimes to naive UTC."""
+    if value.tzinfo:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """Best-effort timestamp parser for API and feed values."""
+    if value is None:
+        return None
+
+    if isinstance(value, datetime):
+        return _normalize_datetime(value)
+
+    if isinstance(value, (int, float)):
+        ts_value = float(value)
+        if ts_value > 10_000_000_000:
+            ts_value = ts_value / 1000.0
+        try:
+            return datetime.fromtimestamp(ts_value, tz=timezone.utc).replace(tzinfo=None)
+        except (ValueError, OverflowError, OSError):
+            return None
+
+    if isinstance(value, str):
+        cleaned = value.strip()
+        if not cleaned:
+            return None
+
+        normalized = cleaned.replace("Z", "+00:00")
+        try:
+            return _normalize_datetime(datetime.fromisoformat(normalized))
+        except ValueError:
+            pass
+
+        try:
+            return _normalize_datetime(parsedate_to_datetime(cleaned))
+        except (TypeError, ValueError):
+            pass
+
+        for fmt in ("%Y-%m-%d", "%Y/%m/%d"):
+            try:
+                return datetime.strptime(cleaned, fmt)
+            except ValueError:
+                continue
+
+    return None
+
+
+def parse_feed_entry_timestamp(entry: Any) -> Optional[datetime]:
+    """Extract timestamp from feedparser entry."""
+    for parsed_key in ("published_parsed", "updated_parsed", "created_parsed"):
+        parsed_value = entry.get(parsed_key)
+        if parsed_value:
+            try:
+                return datetime(*parsed_value[:6])
+            except (TypeError, ValueError):
+                continue
+
+    for key in ("published", "updated", "created", "dc_date", "pubDate"):
+        parsed = parse_timestamp(entry.get(key))
+        if parsed:
+            return parsed
+    return None
+
+
+def _rss_item_entry(item: etree._Element) -> Dict[str, Any]:
+    """Map an RSS 2.0 <item> onto the feedparser entry keys the collectors read."""
+    title = (item.findtext("title") or "").strip()
+    entry: Dict[str, Any] = {"title": html.unescape(title) if "&" in title else title}
+
+    link = (item.findtext("link") or "").strip()
+    guid = item.find("guid")
+    if not link and guid is not None and guid.get("isPermaLink", "true").lower() != "false":
+        link = (guid.text or "").strip()
+    if link:
+        entry["link"] = link
+
+    content = item.findtext(_CONTENT_ENCODED_TAG)
+    if content:
+        entry["content"] = [{"value": content}]
+    summary = item.findtext("description") or content
+    if summary:
+        entry["summary"] = summary
+
+    published = (item.findtext("pubDate") or "").strip()
+    if published:
+        entry["published"] = published
+    updated = (item.findtext(_DC_DATE_TAG) or "").strip()
+    if updated:
+        entry["updated"] = updated
+
+    media_content = [dict(el.attrib) for tag in _MEDIA_CONTENT_TAGS for el in item.iter(tag)]
+    if media_content:
+        entry["media_content"] = media_content
+    media_thumbnail = [dict(el.attrib) for tag in _MEDIA_THUMBNAIL_TAGS for el in item.iter(tag)]
+    if media_thumbnail:
+        entry["media_thumbnail"] = media_thumbnail
+    enclosures = [
+        {"href": el.get("url", ""), "type": el.get("type", ""), "length": el.get("length", "")}
+        for el in item.iterfind("enclosure")
+    ]
+    if enclosures:
+        entry["enclosures"] = enclosures
+
+    return entry
+
+
+def _parse_rss_items(content: bytes, limit: int) -> Optional[List[Dict[str, Any]]]:
+    """Parse plain RSS 2.0 with lxml, or return None when feedparser should handle the feed."""
+    try:
+        root = etree.fromstring(content, etree.XMLParser(resolve_entities=False, no_network=True))
+    except (etree.XMLSyntaxError, ValueError):
+        return None
+    if root.tag != "rss":
+        return None
+    return [_rss_item_entry(item) for item in islice(root.iterfind("channel/item"), limit)]
+
+
+def parse_feed_entries(content: bytes, limit: int) -> List[Any]:
+    """Return up to ``limit`` feed entries, using lxml for RSS 2.0 and feedparser otherwise."""
+    entries = _parse_rss_items(content, limit)
+    if entries is None:
+        entries = feedparser.parse(content).entries[:limit]
+    return entries
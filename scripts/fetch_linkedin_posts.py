@@ -20,13 +20,15 @@ To stay within free limits:
 import json
 import os
 import re
-import time
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from config import setup_logging
+from config import CMMC_TERMS, setup_logging
 
 logger = setup_logging("linkedin_scraper")
 
@@ -37,12 +39,17 @@ DEFAULT_APIFY_ACTOR = "apimaestro/linkedin-profile-posts"
 MAX_PROFILES = 10  # Maximum profiles to scrape per run
 MAX_POSTS_PER_PROFILE = 5  # Maximum posts per profile
 SCRAPER_TIMEOUT_SECONDS = 120  # Max wait time for scraper
+MAX_CONCURRENT_RUNS = 3  # Apify free tier concurrent actor limit
 
 # Last-fetched tracking file
 LAST_FETCHED_FILE = Path(__file__).parent.parent / "data" / "linkedin_last_fetched.json"
 
+_KEYWORD_WORD_RE = re.compile(r"\b[a-zA-Z0-9-]{3,}\b")
+_PROFILE_USERNAME_RE = re.compile(r"linkedin\.com/in/([^/?#]+)")
+_LINE_BREAKS_TO_SPACES = str.maketrans("\r\n\t", "   ")
 
-@dataclass
+
+@dataclass(slots=True)
 class LinkedInPost:
     """Represents a LinkedIn post from a CMMC influencer."""
 
@@ -87,9 +94,9 @@ def _get_profile_username(profile_url: str) -> str:
 
     Example: https://www.linkedin.com/in/katie-arrington-a6949425/ -> katie-arrington-a6949425
     """
-    match = re.search(r"linkedin\.com/in/([^/]+)", profile_url)
+    match = _PROFILE_USERNAME_RE.search(profile_url)
     if match:
-        return match.group(1).rstrip("/")
+        return match.group(1)
     return profile_url
 
 
@@ -105,12 +112,20 @@ def _load_last_fetched() -> dict:
 
 
 def _save_last_fetched(data: dict) -> None:
-    """Save last-fetched tracking data."""
+    """Save last-fetched tracking data atomically via a temp file."""
+    tmp_path = None
     try:
         LAST_FETCHED_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(LAST_FETCHED_FILE, "w") as f:
-            json.dump(data, f, indent=2)
-    except OSError as e:
+        with tempfile.NamedTemporaryFile(
+            "w", dir=LAST_FETCHED_FILE.parent, suffix=".tmp", delete=False, encoding="utf-8"
+        ) as tmp:
+            tmp_path = Path(tmp.name)
+            json.dump(data, tmp, indent=2)
+        os.replace(tmp_path, LAST_FETCHED_FILE)
+    except (OSError, TypeError, ValueError) as e:
+        # Leave the previous file in place and don't strand the partial temp file
+        if tmp_path:
+            tmp_path.unlink(missing_ok=True)
         logger.warning(f"Could not save last-fetched data: {e}")
 
 
@@ -143,54 +158,19 @@ def fetch_linkedin_posts(
     last_fetched = _load_last_fetched()
     last_fetched_ts = last_fetched.get("last_fetched_ts", 0)
 
+    # Each profile is a separate actor run; run them side by side up to the concurrency limit
     posts = []
-
-    for profile_url in profiles_to_scrape:
-        try:
-            username = _get_profile_username(profile_url)
-            logger.info(f"Fetching posts from: {username}")
-
-            # Prepare input for the new actor
-            run_input = {
-                "username": username,
-                "total_posts": max_posts_per_profile,
-            }
-
-            # Run the actor and wait for completion
-            run = client.actor(actor_id).call(
-                run_input=run_input,
-                timeout_secs=SCRAPER_TIMEOUT_SECONDS,
-            )
-
-            # Fetch results from the dataset
-            dataset_items = list(client.dataset(run["defaultDatasetId"]).iterate_items())
-
-            new_count = 0
-            for item in dataset_items:
-                # Filter out reposts
-                post_type = item.get("post_type", "regular")
-                if post_type == "repost":
-                    continue
-
-                # Filter out posts older than last fetch
-                posted_at = item.get("posted_at", {})
-                post_ts = posted_at.get("timestamp", 0)
-                if last_fetched_ts and post_ts and post_ts <= last_fetched_ts:
-                    continue
-
-                post = _parse_linkedin_item(item)
-                if post:
-                    posts.append(post)
-                    new_count += 1
-
-            logger.info(f"  Found {len(dataset_items)} posts, {new_count} new (filtered reposts and old)")
-
-            # Small delay between profiles to be respectful
-            time.sleep(1)
-
-        except Exception as e:
-            logger.warning(f"Failed to fetch posts from {profile_url}: {e}")
-            continue
+    workers = max(1, min(MAX_CONCURRENT_RUNS, len(profiles_to_scrape)))
+    scrape = partial(
+        _scrape_profile,
+        client,
+        actor_id,
+        max_posts_per_profile=max_posts_per_profile,
+        last_fetched_ts=last_fetched_ts,
+    )
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for profile_posts in executor.map(scrape, profiles_to_scrape):
+            posts.extend(profile_posts)
 
     # Update last-fetched timestamp
     if posts:
@@ -206,6 +186,59 @@ def fetch_linkedin_posts(
     return posts
 
 
+def _scrape_profile(
+    client,
+    actor_id: str,
+    profile_url: str,
+    max_posts_per_profile: int,
+    last_fetched_ts: int,
+) -> List[LinkedInPost]:
+    """Run the actor for one profile and return its new, non-repost posts."""
+    posts = []
+    try:
+        username = _get_profile_username(profile_url)
+        logger.info(f"Fetching posts from: {username}")
+
+        # Prepare input for the new actor
+        run_input = {
+            "username": username,
+            "total_posts": max_posts_per_profile,
+        }
+
+        # Run the actor and wait for completion
+        run = client.actor(actor_id).call(
+            run_input=run_input,
+            timeout_secs=SCRAPER_TIMEOUT_SECONDS,
+        )
+
+        # Stream results from the dataset, parsing each page as it arrives
+        total = 0
+        for item in client.dataset(run["defaultDatasetId"]).iterate_items():
+            total += 1
+
+            # Filter out reposts
+            post_type = item.get("post_type", "regular")
+            if post_type == "repost":
+                continue
+
+            # Filter out posts older than last fetch
+            posted_at = item.get("posted_at") or {}
+            post_ts = posted_at.get("timestamp", 0)
+            if last_fetched_ts and post_ts and post_ts <= last_fetched_ts:
+                continue
+
+            post = _parse_linkedin_item(item)
+            if post:
+                posts.append(post)
+
+        logger.info(f"  {username}: {total} posts, {len(posts)} new (filtered reposts and old)")
+
+    except Exception as e:
+        logger.warning(f"Failed to fetch posts from {profile_url}: {e}")
+
+    return posts
+
+
 def _parse_linkedin_item(item: Dict) -> Optional[LinkedInPost]:
     """
     Parse a raw Apify result item into a LinkedInPost.
@@ -219,7 +252,7 @@ def _parse_linkedin_item(item: Dict) -> Optional[LinkedInPost]:
             return None
 
         # Extract author info
-        author = item.get("author", {})
+        author = item.get("author") or {}
         first_name = author.get("first_name", "")
         last_name = author.get("last_name", "")
         author_name = f"{first_name} {last_name}".strip() or "Unknown"
@@ -232,7 +265,7 @@ def _parse_linkedin_item(item: Dict) -> Optional[LinkedInPost]:
 
         # Extract timestamp
         timestamp = None
-        posted_at = item.get("posted_at", {})
+        posted_at = item.get("posted_at") or {}
         date_str = posted_at.get("date", "")
         if date_str:
             try:
@@ -242,7 +275,7 @@ def _parse_linkedin_item(item: Dict) -> Optional[LinkedInPost]:
                 pass
 
         # Extract engagement metrics
-        stats = item.get("stats", {})
+        stats = item.get("stats") or {}
         likes = int(stats.get("total_reactions", 0) or 0)
         comments = int(stats.get("comments", 0) or 0)
         shares = int(stats.get("reposts", 0) or 0)
@@ -251,7 +284,7 @@ def _parse_linkedin_item(item: Dict) -> Optional[LinkedInPost]:
         post_type = item.get("post_type", "regular")
 
         # Create title from content excerpt
-        title = content[:100].replace("\n", " ").strip()
+        title = content[:100].translate(_LINE_BREAKS_TO_SPACES).strip()
         if len(content) > 100:
             title += "..."
 
@@ -287,6 +320,7 @@ def linkedin_posts_to_trends(posts: List[LinkedInPost]) -> List[Dict]:
         List of trend dictionaries compatible with Trend dataclass
     """
     trends = []
+    now = datetime.now()
 
     for post in posts:
         # Create a trend-compatible dictionary
@@ -296,7 +330,7 @@ def linkedin_posts_to_trends(posts: List[LinkedInPost]) -> List[Dict]:
             "url": post.post_url or post.author_url,
             "description": post.content[:500],
             "category": "cmmc",
-            "score": _calculate_post_score(post),
+            "score": _calculate_post_score(post, now),
             "keywords": _extract_keywords(post.content),
             "timestamp": post.timestamp.isoformat() if post.timestamp else None,
             "image_url": None,
@@ -314,11 +348,11 @@ def linkedin_posts_to_trends(posts: List[LinkedInPost]) -> List[Dict]:
     return trends
 
 
-def _calculate_post_score(post: LinkedInPost) -> float:
+def _calculate_post_score(post: LinkedInPost, now: datetime) -> float:
     """
     Calculate a relevance score for a LinkedIn post.
 
-    Based on engagement metrics and recency.
+    Based on engagement metrics and recency relative to ``now``.
     """
     base_score = 1.5  # LinkedIn posts from key people are valuable
 
@@ -329,7 +363,7 @@ def _calculate_post_score(post: LinkedInPost) -> float:
     # Recency boost
     recency_boost = 0.0
     if post.timestamp:
-        age_hours = (datetime.now() - post.timestamp).total_seconds() / 3600
+        age_hours = (now - post.timestamp).total_seconds() / 3600
         if age_hours < 24:
             recency_boost = 0.5
         elif age_hours < 72:
@@ -340,37 +374,15 @@ def _calculate_post_score(post: LinkedInPost) -> float:
 
 def _extract_keywords(content: str) -> List[str]:
     """Extract meaningful keywords from post content."""
-    # CMMC-specific keywords to look for
-    cmmc_terms = {
-        "cmmc",
-        "nist",
-        "dfars",
-        "c3pao",
-        "cui",
-        "fedramp",
-        "cybersecurity",
-        "compliance",
-        "dod",
-        "defense",
-        "certification",
-        "assessment",
-        "800-171",
-        "contractor",
-        "security",
-    }
-
-    # Extract words
-    words = re.findall(r"\b[a-zA-Z0-9-]{3,}\b", content.lower())
-
-    # Find CMMC-related keywords
+    # Find CMMC-related keywords in order of first appearance
     keywords = []
-    seen = set()
-    for word in words:
-        if word in cmmc_terms and word not in seen:
+    for word in _KEYWORD_WORD_RE.findall(content.lower()):
+        if word in CMMC_TERMS and word not in keywords:
             keywords.append(word)
-            seen.add(word)
+            if len(keywords) == 5:  # Top 5 keywords
+                break
 
-    return keywords[:5]  # Top 5 keywords
+    return keywords
 
 
 def test_connection() -> bool:
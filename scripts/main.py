@@ -20,6 +20,7 @@ import json
 import os
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -56,15 +57,20 @@ def _to_dict_list(items):
     return [_to_dict(item) for item in items]
 
 
-def _safe_write_json(path: Path, data, **json_kwargs) -> None:
-    """Write JSON to path atomically via a temp file in the same directory."""
+def _safe_write_text(path: Path, text: str) -> None:
+    """Write text to path atomically via a temp file in the same directory."""
     path = Path(path)
     with tempfile.NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False, encoding="utf-8") as tmp:
-        json.dump(data, tmp, **json_kwargs)
+        tmp.write(text)
         tmp_path = Path(tmp.name)
     os.replace(tmp_path, path)
 
 
+def _safe_write_json(path: Path, data, **json_kwargs) -> None:
+    """Write JSON to path atomically via a temp file in the same directory."""
+    _safe_write_text(path, json.dumps(data, **json_kwargs))
+
+
 def _load_json_dict(path: Path, required_keys: set = None) -> dict:
     """Load a JSON file expected to be a dict.
 
@@ -115,9 +121,14 @@ class CMMCWatchPipeline:
         # Pipeline data
         self.trends = []
         self.images = []
+        # Dict views of trends/images, converted once and shared by later steps
+        self.trend_dicts = []
+        self.image_dicts = []
         self.design = None
         self.keywords = []
         self.editorial_article = None
+        # design.json as read in step 1, reused by _generate_design
+        self.saved_design = None
 
     def run(self, archive: bool = True, dry_run: bool = False) -> bool:
         """Run the complete pipeline."""
@@ -136,12 +147,13 @@ class CMMCWatchPipeline:
             if archive:
                 logger.info("[1/10] Archiving previous website...")
                 # Load previous design to save with archive
-                prev_design = _load_json_dict(self.data_dir / "design.json")
-                self.archive_manager.archive_current(design=prev_design)
+                self.saved_design = _load_json_dict(self.data_dir / "design.json")
+                self.archive_manager.archive_current(design=self.saved_design)
 
             # Step 2: Collect trends
             logger.info("[2/10] Collecting CMMC trends...")
             self.trends = self.trend_collector.collect_all()
+            self.trend_dicts = _to_dict_list(self.trends)
             self.keywords = self.trend_collector.get_global_keywords()
             logger.info(f"Collected {len(self.trends)} CMMC trends")
 
@@ -153,36 +165,41 @@ class CMMCWatchPipeline:
                 logger.info("Dry run - skipping build steps")
                 return True
 
-            # Step 3: Fetch images
+            # Step 3: Fetch images in the background - design and editorial don't use them
             logger.info("[3/10] Fetching images...")
             image_keywords = self.keywords[:5] if self.keywords else ["cybersecurity", "compliance"]
-            self.images = self.image_fetcher.fetch_for_keywords(image_keywords)
-            logger.info(f"Fetched {len(self.images)} images")
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                images_future = executor.submit(self.image_fetcher.fetch_for_keywords, image_keywords)
+
+                # Step 4: Generate design
+                logger.info("[4/10] Generating design...")
+                self.design = self._generate_design()
+                logger.info(f"Theme: {self.design.get('theme_name', 'default')}")
 
-            # Step 4: Generate design
-            logger.info("[4/10] Generating design...")
-            self.design = self._generate_design()
-            logger.info(f"Theme: {self.design.get('theme_name', 'default')}")
+                # Step 5: Generate editorial
+                logger.info("[5/10] Generating editorial content...")
+                self._generate_editorial()
 
-            # Step 5: Generate editorial
-            logger.info("[5/10] Generating editorial content...")
-            self._generate_editorial()
+                self.images = images_future.result()
+                self.image_dicts = _to_dict_list(self.images)
+            logger.info(f"Fetched {len(self.images)} images")
 
             # Step 6: Build website
             logger.info("[6/10] Building website...")
             self._build_website()
 
-            # Step 7: Generate RSS
+            # Steps 7-9: RSS, PWA assets and sitemap write separate files, so run them together
             logger.info("[7/10] Generating RSS feed...")
-            self._generate_rss()
-
-            # Step 8: PWA assets
             logger.info("[8/10] Generating PWA assets...")
-            save_pwa_assets(self.public_dir)
-
-            # Step 9: Sitemap
             logger.info("[9/10] Generating sitemap...")
-            save_sitemap(self.public_dir, base_url="https://cmmcwatch.com")
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [
+                    executor.submit(self._generate_rss),
+                    executor.submit(save_pwa_assets, self.public_dir),
+                    executor.submit(save_sitemap, self.public_dir, base_url="https://cmmcwatch.com"),
+                ]
+                for future in futures:
+                    future.result()
 
             # Step 10: Cleanup
             logger.info("[10/10] Cleaning up old archives...")
@@ -261,14 +278,14 @@ class CMMCWatchPipeline:
         design_file = self.data_dir / "design.json"
         today = datetime.now().strftime("%Y-%m-%d")
 
-        # Check for existing today's design
-        existing = _load_json_dict(design_file, required_keys={"design_seed"})
+        # Check for existing today's design, reusing the copy read for the archive
+        existing = self.saved_design or _load_json_dict(design_file, required_keys={"design_seed"})
         if existing and existing.get("design_seed") == today:
             return existing
 
         # Generate new design - convert trends to dicts first
         design = self.design_generator.generate(
-            trends=_to_dict_list(self.trends[:5]),
+            trends=self.trend_dicts[:5],
             keywords=self.keywords[:10],
         )
 
@@ -282,7 +299,7 @@ class CMMCWatchPipeline:
         """Generate daily editorial article."""
         try:
             self.editorial_article = self.editorial_generator.generate_editorial(
-                trends=_to_dict_list(self.trends[:20]),
+                trends=self.trend_dicts[:20],
                 keywords=self.keywords,
                 design=self.design,
             )
@@ -303,8 +320,9 @@ class CMMCWatchPipeline:
         from build_website import BuildContext, WebsiteBuilder
 
         context = BuildContext(
-            trends=_to_dict_list(self.trends),
-            images=_to_dict_list(self.images),
+            # WebsiteBuilder annotates trends in place; shallow copies keep the saved data clean
+            trends=[dict(trend) for trend in self.trend_dicts],
+            images=self.image_dicts,
             design=self.design,
             keywords=self.keywords,
             editorial_article=(_to_dict(self.editorial_article) if self.editorial_article else None),
@@ -314,15 +332,14 @@ class CMMCWatchPipeline:
         html = builder.build()
 
         output_path = self.public_dir / "index.html"
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html)
+        _safe_write_text(output_path, html)
 
         logger.info(f"Website saved to {output_path}")
 
     def _generate_rss(self):
         """Generate RSS feed."""
         generate_rss_feed(
-            trends=_to_dict_list(self.trends[:50]),
+            trends=self.trend_dicts[:50],
             output_path=self.public_dir / "feed.xml",
             title="CMMC Watch",
             description="Daily CMMC & Compliance News Aggregator",
@@ -332,8 +349,8 @@ class CMMCWatchPipeline:
 
     def _save_data(self):
         """Save pipeline data to JSON files atomically."""
-        _safe_write_json(self.data_dir / "trends.json", _to_dict_list(self.trends), indent=2, default=str)
-        _safe_write_json(self.data_dir / "images.json", _to_dict_list(self.images), indent=2, default=str)
+        _safe_write_json(self.data_dir / "trends.json", self.trend_dicts, indent=2, default=str)
+        _safe_write_json(self.data_dir / "images.json", self.image_dicts, indent=2, default=str)
         _safe_write_json(self.data_dir / "design.json", self.design, indent=2, default=str)
         logger.info(f"Pipeline data saved to {self.data_dir}")
 
@@ -21,15 +21,17 @@ import json
 import logging
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
-import feedparser
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
 from config import DATA_DIR, TIMEOUTS, setup_logging
+from feed_parsing import parse_feed_entries, parse_feed_entry_timestamp
 
 # Initialize logger
 logger = setup_logging("competitor_monitor")
@@ -41,6 +43,13 @@ COMPETITOR_DATA_DIR.mkdir(parents=True, exist_ok=True)
 # Cache file for tracking previously seen items
 SEEN_ITEMS_FILE = COMPETITOR_DATA_DIR / "seen_items.json"
 
+# ETag/Last-Modified validators per source, replayed as conditional GETs
+FEED_META_FILE = COMPETITOR_DATA_DIR / "feed_meta.json"
+
+# White & Case listing markup: article card and summary class names
+_WC_ARTICLE_CLASS_RE = re.compile(r"insight|article|item", re.I)
+_WC_SUMMARY_CLASS_RE = re.compile(r"summary|excerpt|desc", re.I)
+
 
 @dataclass
 class MonitoredItem:
@@ -61,6 +70,20 @@ class MonitoredItem:
             self.item_hash = hashlib.md5(f"{self.source}:{self.url}".encode()).hexdigest()[:12]
 
 
+def _element_text(element) -> str:
+    """Text content of an lxml element with whitespace collapsed."""
+    return " ".join(element.text_content().split())
+
+
+def _keyword_weight(keyword: str) -> float:
+    """Relevance weight for a keyword; more specific keywords weigh more."""
+    if keyword in ("cmmc", "cmmc 2.0", "c3pao", "cyber-ab"):
+        return 2.0
+    if keyword in ("dfars", "nist 800-171", "cui"):
+        return 1.5
+    return 1.0
+
+
 class CompetitorMonitor:
     """Monitors competitor and industry sources for CMMC-related content."""
 
@@ -82,6 +105,7 @@ class CompetitorMonitor:
         "fedramp",
         "fisma",
     ]
+    KEYWORD_WEIGHTS = tuple((keyword, _keyword_weight(keyword)) for keyword in CMMC_KEYWORDS)
 
     # Source configurations
     SOURCES = {
@@ -139,6 +163,9 @@ class CompetitorMonitor:
             }
         )
         self.seen_items = self._load_seen_items()
+        # One timestamp per run for every item marked as seen
+        self.run_started_at = datetime.now().isoformat()
+        self.feed_meta = self._load_feed_meta()
         self.results: List[MonitoredItem] = []
 
     def _load_seen_items(self) -> Dict[str, str]:
@@ -162,26 +189,67 @@ class CompetitorMonitor:
         except Exception as e:
             logger.warning(f"Failed to save seen items: {e}")
 
-    def _calculate_relevance(self, text: str) -> float:
-        """Calculate relevance score based on keyword matches."""
-        if not text:
+    def _load_feed_meta(self) -> Dict[str, Dict[str, str]]:
+        """Load stored HTTP validators per source."""
+        if FEED_META_FILE.exists():
+            try:
+                with open(FEED_META_FILE, "r") as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.warning(f"Failed to load feed metadata: {e}")
+        return {}
+
+    def _save_feed_meta(self):
+        """Save HTTP validators per source."""
+        try:
+            with open(FEED_META_FILE, "w") as f:
+                json.dump(self.feed_meta, f, indent=2)
+        except Exception as e:
+            logger.warning(f"Failed to save feed metadata: {e}")
+
+    def _conditional_get(self, source_key: str, url: str, params: Optional[Dict] = None) -> Optional[requests.Response]:
+        """GET a source, replaying stored validators. Returns None when it is unchanged (304)."""
+        request_url = requests.Request("GET", url, params=params).prepare().url
+        headers = {}
+        meta = self.feed_meta.get(source_key, {})
+        if meta.get("url") == request_url:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = self.session.get(request_url, headers=headers or None, timeout=TIMEOUTS.get("default", 15))
+        if response.status_code == 304 and headers:
+            return None
+        response.raise_for_status()
+        return response
+
+    def _remember_validators(self, source_key: str, response: requests.Response):
+        """Store a processed response's validators so the next run can ask for changes only."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            # Key on the URL originally requested, before any redirects
+            first_response = response.history[0] if response.history else response
+            self.feed_meta[source_key] = {
+                "url": first_response.request.url,
+                "etag": etag or "",
+                "last_modified": last_modified or "",
+            }
+        else:
+            self.feed_meta.pop(source_key, None)
+
+    def _calculate_relevance(self, text_lower: str) -> float:
+        """Calculate relevance score from keyword matches in already-lowercased text."""
+        if not text_lower:
             return 0.0
-        text_lower = text.lower()
         score = 0.0
-        matched_keywords = []
-
-        for keyword in self.CMMC_KEYWORDS:
+        for keyword, weight in self.KEYWORD_WEIGHTS:
             if keyword in text_lower:
-                # Weight more specific keywords higher
-                if keyword in ["cmmc", "cmmc 2.0", "c3pao", "cyber-ab"]:
-                    score += 2.0
-                elif keyword in ["dfars", "nist 800-171", "cui"]:
-                    score += 1.5
-                else:
-                    score += 1.0
-                matched_keywords.append(keyword)
-
-        return min(score / 10.0, 1.0)  # Normalize to 0-1
+                score += weight
+                if score >= 10.0:
+                    return 1.0  # Already at the normalization ceiling
+        return score / 10.0  # Normalize to 0-1
 
     def _is_new_item(self, item: MonitoredItem) -> bool:
         """Check if item is new (not seen before)."""
@@ -189,7 +257,7 @@ class CompetitorMonitor:
 
     def _mark_as_seen(self, item: MonitoredItem):
         """Mark item as seen."""
-        self.seen_items[item.item_hash] = datetime.now().isoformat()
+        self.seen_items[item.item_hash] = self.run_started_at
 
     def monitor_federal_register(self) -> List[MonitoredItem]:
         """Monitor Federal Register for DFARS/CMMC regulatory changes."""
@@ -197,12 +265,10 @@ class CompetitorMonitor:
         items = []
 
         try:
-            response = self.session.get(
-                source_config["base_url"],
-                params=source_config["params"],
-                timeout=TIMEOUTS.get("default", 15),
-            )
-            response.raise_for_status()
+            response = self._conditional_get("federal_register", source_config["base_url"], source_config["params"])
+            if response is None:
+                logger.info("[Federal Register] Not modified since last run")
+                return items
             data = response.json()
 
             for doc in data.get("results", []):
@@ -211,7 +277,7 @@ class CompetitorMonitor:
                 summary = doc.get("abstract", "")
 
                 # Calculate relevance
-                text = f"{title} {summary}"
+                text = f"{title} {summary}".lower()
                 relevance = self._calculate_relevance(text)
 
                 if relevance > 0.1:  # Only include relevant items
@@ -229,6 +295,8 @@ class CompetitorMonitor:
                         self._mark_as_seen(item)
                         logger.info(f"[Federal Register] New: {title[:60]}... (relevance: {relevance:.2f})")
 
+            self._remember_validators("federal_register", response)
+
         except Exception as e:
             logger.error(f"Federal Register monitor failed: {e}")
 
@@ -240,9 +308,12 @@ class CompetitorMonitor:
         items = []
 
         try:
-            feed = feedparser.parse(source_config["url"])
+            response = self._conditional_get(source_key, source_config["url"])
+            if response is None:
+                logger.info(f"[{source_config['name']}] Not modified since last run")
+                return items
 
-            for entry in feed.entries[:20]:  # Limit to 20 most recent
+            for entry in parse_feed_entries(response.content, 20):  # Limit to 20 most recent
                 title = entry.get("title", "")
                 url = entry.get("link", "")
                 summary = entry.get("summary", entry.get("description", ""))
@@ -254,15 +325,11 @@ class CompetitorMonitor:
                         continue
 
                 # Calculate relevance
-                relevance = self._calculate_relevance(f"{title} {summary}")
+                relevance = self._calculate_relevance(text)
 
                 # Parse date
-                published = None
-                if hasattr(entry, "published_parsed") and entry.published_parsed:
-                    try:
-                        published = datetime(*entry.published_parsed[:6]).strftime("%Y-%m-%d")
-                    except Exception:
-                        pass
+                published_at = parse_feed_entry_timestamp(entry)
+                published = published_at.strftime("%Y-%m-%d") if published_at else None
 
                 item = MonitoredItem(
                     title=title,
@@ -278,6 +345,8 @@ class CompetitorMonitor:
                     self._mark_as_seen(item)
                     logger.info(f"[{source_config['name']}] New: {title[:60]}... (relevance: {relevance:.2f})")
 
+            self._remember_validators(source_key, response)
+
         except Exception as e:
             logger.error(f"{source_config['name']} monitor failed: {e}")
 
@@ -295,32 +364,39 @@ class CompetitorMonitor:
             )
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "lxml")
+            tree = lxml.html.fromstring(response.content)
 
             # Find insight articles
-            articles = soup.find_all("article") or soup.find_all(
-                "div", class_=re.compile(r"insight|article|item", re.I)
-            )
+            articles = tree.xpath("//article") or [
+                div for div in tree.iter("div") if _WC_ARTICLE_CLASS_RE.search(div.get("class", ""))
+            ]
 
             for article in articles[:15]:
                 # Extract title and link
-                link_elem = article.find("a", href=True)
-                if not link_elem:
+                link_elem = next(iter(article.xpath(".//a[@href]")), None)
+                if link_elem is None:
                     continue
 
-                title = link_elem.get_text(strip=True)
-                url = urljoin(source_config["url"], link_elem["href"])
+                title = _element_text(link_elem)
+                url = urljoin(source_config["url"], link_elem.get("href"))
 
                 # Extract summary if available
-                summary_elem = article.find(["p", "div"], class_=re.compile(r"summary|excerpt|desc", re.I))
-                summary = summary_elem.get_text(strip=True) if summary_elem else ""
+                summary_elem = next(
+                    (
+                        elem
+                        for elem in article.iterdescendants("p", "div")
+                        if _WC_SUMMARY_CLASS_RE.search(elem.get("class", ""))
+                    ),
+                    None,
+                )
+                summary = _element_text(summary_elem) if summary_elem is not None else ""
 
                 # Check for keyword relevance
                 text = f"{title} {summary}".lower()
                 if not any(kw in text for kw in source_config["filter_keywords"]):
                     continue
 
-                relevance = self._calculate_relevance(f"{title} {summary}")
+                relevance = self._calculate_relevance(text)
 
                 item = MonitoredItem(
                     title=title,
@@ -341,51 +417,35 @@ class CompetitorMonitor:
         return items
 
     def run_all_monitors(self) -> List[MonitoredItem]:
-        """Run all configured monitors."""
+        """Run all configured monitors concurrently."""
+        rss = self.monitor_rss_source
+        monitors: List[Tuple[str, Callable[[], List[MonitoredItem]]]] = [
+            ("Federal Register", self.monitor_federal_register),
+            ("DefenseScoop", partial(rss, "defensescoop")),
+            (
+                "Preveil Blog",
+                partial(rss, "preveil_blog", filter_keywords=["cmmc", "compliance", "nist", "government"]),
+            ),
+            ("White & Case", self.monitor_white_case),
+            ("NIST CSF News", partial(rss, "nist_csf", filter_keywords=self.SOURCES["nist_csf"]["filter_keywords"])),
+            ("Cyberscoop", partial(rss, "cyberscoop", filter_keywords=["cmmc", "dod", "defense", "pentagon", "nist"])),
+            ("FCW", partial(rss, "fcw", filter_keywords=["cmmc", "cybersecurity", "defense", "dod"])),
+        ]
+
+        def _run(monitor: Tuple[str, Callable[[], List[MonitoredItem]]]) -> List[MonitoredItem]:
+            name, check = monitor
+            logger.info(f"Checking {name}...")
+            return check()
+
+        # Each monitor is one or two network round-trips, so run them side by side
         all_items = []
+        with ThreadPoolExecutor(max_workers=len(monitors)) as executor:
+            for items in executor.map(_run, monitors):
+                all_items.extend(items)
 
-        # Federal Register
-        logger.info("Checking Federal Register...")
-        all_items.extend(self.monitor_federal_register())
-
-        # DefenseScoop
-        logger.info("Checking DefenseScoop...")
-        all_items.extend(self.monitor_rss_source("defensescoop"))
-
-        # Preveil Blog
-        logger.info("Checking Preveil Blog...")
-        all_items.extend(
-            self.monitor_rss_source(
-                "preveil_blog",
-                filter_keywords=["cmmc", "compliance", "nist", "government"],
-            )
-        )
-
-        # White & Case
-        logger.info("Checking White & Case...")
-        all_items.extend(self.monitor_white_case())
-
-        # NIST CSF News
-        logger.info("Checking NIST CSF News...")
-        all_items.extend(
-            self.monitor_rss_source("nist_csf", filter_keywords=self.SOURCES["nist_csf"]["filter_keywords"])
-        )
-
-        # Cyberscoop
-        logger.info("Checking Cyberscoop...")
-        all_items.extend(
-            self.monitor_rss_source(
-                "cyberscoop",
-                filter_keywords=["cmmc", "dod", "defense", "pentagon", "nist"],
-            )
-        )
-
-        # FCW
-        logger.info("Checking FCW...")
-        all_items.extend(self.monitor_rss_source("fcw", filter_keywords=["cmmc", "cybersecurity", "defense", "dod"]))
-
-        # Save seen items
+        # Save seen items and feed validators
         self._save_seen_items()
+        self._save_feed_meta()
 
         # Sort by relevance
         all_items.sort(key=lambda x: x.relevance_score, reverse=True)
@@ -408,6 +468,7 @@ class CompetitorMonitor:
             items = self.monitor_rss_source(source_key, filter_keywords=source_config.get("filter_keywords"))
 
         self._save_seen_items()
+        self._save_feed_meta()
         return items
 
 
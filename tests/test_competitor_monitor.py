@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Tests for competitor monitor conditional fetching."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+# Add scripts and tools to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts" / "tools"))
+
+import competitor_monitor
+from competitor_monitor import CompetitorMonitor
+
+RSS_BODY = (
+    b"<rss><channel><item><title>DoD finalizes CMMC rule</title>"
+    b"<link>https://defensescoop.com/cmmc-rule</link>"
+    b"<description>CMMC and DFARS update for contractors</description></item></channel></rss>"
+)
+
+
+def _mock_response(url: str, status: int, content: bytes, headers: dict | None = None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = content
+    response.url = url
+    response.request = requests.Request("GET", url).prepare()
+    response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    return response
+
+
+@pytest.fixture
+def monitor(tmp_path, monkeypatch):
+    monkeypatch.setattr(competitor_monitor, "SEEN_ITEMS_FILE", tmp_path / "seen_items.json")
+    monkeypatch.setattr(competitor_monitor, "FEED_META_FILE", tmp_path / "feed_meta.json")
+    return CompetitorMonitor()
+
+
+class TestConditionalGet:
+    """Test ETag/Last-Modified replay for monitored sources."""
+
+    def test_not_modified_yields_no_items(self, monitor):
+        url = monitor.SOURCES["defensescoop"]["url"]
+        stored = {"url": url, "etag": '"abc123"', "last_modified": "Wed, 14 Oct 2026 10:00:00 GMT"}
+        monitor.feed_meta["defensescoop"] = dict(stored)
+        monitor.session.get = MagicMock(return_value=_mock_response(url, 304, b""))
+
+        items = monitor.monitor_rss_source("defensescoop")
+
+        sent_headers = monitor.session.get.call_args.kwargs["headers"]
+        assert sent_headers["If-None-Match"] == '"abc123"'
+        assert sent_headers["If-Modified-Since"] == "Wed, 14 Oct 2026 10:00:00 GMT"
+        assert items == []
+        assert monitor.feed_meta["defensescoop"] == stored
+
+    def test_validators_saved_only_after_items_processed(self, monitor):
+        url = monitor.SOURCES["defensescoop"]["url"]
+        headers = {"ETag": '"v2"', "Last-Modified": "Thu, 15 Oct 2026 10:00:00 GMT"}
+        monitor.session.get = MagicMock(return_value=_mock_response(url, 200, RSS_BODY, headers))
+        monitor._calculate_relevance = MagicMock(side_effect=RuntimeError("scoring failed"))
+
+        assert monitor.monitor_rss_source("defensescoop") == []
+        assert "defensescoop" not in monitor.feed_meta
+
+        del monitor._calculate_relevance
+        items = monitor.monitor_rss_source("defensescoop")
+
+        assert [item.title for item in items] == ["DoD finalizes CMMC rule"]
+        assert monitor.feed_meta["defensescoop"] == {
+            "url": url,
+            "etag": '"v2"',
+            "last_modified": "Thu, 15 Oct 2026 10:00:00 GMT",
+        }
+
+        monitor._save_feed_meta()
+        saved = json.loads(competitor_monitor.FEED_META_FILE.read_text())
+        assert saved["defensescoop"]["etag"] == '"v2"'
+
+    def test_validators_keyed_by_url_and_params(self, monitor):
+        base_url = "https://www.federalregister.gov/api/v1/documents.json"
+        first_url = requests.Request("GET", base_url, params={"page": 1}).prepare().url
+        monitor.session.get = MagicMock(return_value=_mock_response(first_url, 200, b"{}", {"ETag": '"p1"'}))
+
+        monitor._remember_validators(
+            "federal_register", monitor._conditional_get("federal_register", base_url, {"page": 1})
+        )
+        assert monitor.feed_meta["federal_register"]["url"] == first_url
+
+        monitor._conditional_get("federal_register", base_url, {"page": 1})
+        assert monitor.session.get.call_args.kwargs["headers"] == {"If-None-Match": '"p1"'}
+
+        monitor._conditional_get("federal_register", base_url, {"page": 2})
+        assert monitor.session.get.call_args.kwargs["headers"] is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
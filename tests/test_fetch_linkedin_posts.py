@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Tests for LinkedIn post scraping via Apify."""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import fetch_linkedin_posts
+from fetch_linkedin_posts import _get_profile_username, _parse_linkedin_item
+from fetch_linkedin_posts import fetch_linkedin_posts as fetch_posts
+
+LAST_FETCHED_TS = 1_760_000_000_000
+
+
+def _item(text: str, timestamp: int, **overrides) -> dict:
+    item = {
+        "text": text,
+        "url": f"https://www.linkedin.com/posts/{timestamp}",
+        "post_type": "regular",
+        "author": {"first_name": "Katie", "last_name": "Arrington", "headline": "CMMC"},
+        "posted_at": {"timestamp": timestamp, "date": "2026-10-14 09:30:00"},
+        "stats": {"total_reactions": 10, "comments": 2, "reposts": 1},
+    }
+    item.update(overrides)
+    return item
+
+
+class _FakeActor:
+    def __init__(self, delays: dict):
+        self.delays = delays
+
+    def call(self, run_input, timeout_secs):
+        username = run_input["username"]
+        # Finish the first profile last so result order can't depend on completion order
+        time.sleep(self.delays.get(username, 0))
+        return {"defaultDatasetId": username}
+
+
+class _FakeDataset:
+    def __init__(self, items: list):
+        self.items = items
+
+    def iterate_items(self):
+        yield from self.items
+
+
+class _FakeApifyClient:
+    def __init__(self, datasets: dict, delays: dict | None = None):
+        self.datasets = datasets
+        self.delays = delays or {}
+
+    def actor(self, actor_id):
+        return _FakeActor(self.delays)
+
+    def dataset(self, dataset_id):
+        return _FakeDataset(self.datasets[dataset_id])
+
+
+@pytest.fixture
+def last_fetched_file(tmp_path, monkeypatch):
+    path = tmp_path / "linkedin_last_fetched.json"
+    path.write_text(json.dumps({"last_fetched_ts": LAST_FETCHED_TS}))
+    monkeypatch.setattr(fetch_linkedin_posts, "LAST_FETCHED_FILE", path)
+    return path
+
+
+class TestFetchLinkedInPosts:
+    """Test concurrent profile scraping and filtering."""
+
+    def test_results_keep_profile_order_and_skip_reposts_and_old_posts(self, monkeypatch, last_fetched_file):
+        client = _FakeApifyClient(
+            datasets={
+                "first": [
+                    _item("First profile CMMC update", LAST_FETCHED_TS + 1),
+                    _item("Reshared post", LAST_FETCHED_TS + 2, post_type="repost"),
+                    _item("Already seen post", LAST_FETCHED_TS - 1),
+                ],
+                "second": [_item("Second profile NIST note", LAST_FETCHED_TS + 3)],
+                "third": [_item("Third profile DFARS note", LAST_FETCHED_TS + 4)],
+            },
+            delays={"first": 0.2},
+        )
+        monkeypatch.setattr(fetch_linkedin_posts, "get_apify_client", lambda: client)
+
+        posts = fetch_posts(
+            [
+                "https://www.linkedin.com/in/first/",
+                "https://www.linkedin.com/in/second",
+                "https://www.linkedin.com/in/third?trk=feed",
+            ]
+        )
+
+        assert [post.title for post in posts] == [
+            "First profile CMMC update",
+            "Second profile NIST note",
+            "Third profile DFARS note",
+        ]
+        assert json.loads(last_fetched_file.read_text())["last_fetched_ts"] > LAST_FETCHED_TS
+
+    def test_null_nested_fields_are_tolerated(self, monkeypatch, last_fetched_file):
+        item = _item("CMMC post with sparse metadata", 0, author=None, stats=None, posted_at=None)
+        client = _FakeApifyClient(datasets={"sparse": [item]})
+        monkeypatch.setattr(fetch_linkedin_posts, "get_apify_client", lambda: client)
+
+        posts = fetch_posts(["https://www.linkedin.com/in/sparse"])
+
+        assert len(posts) == 1
+        assert posts[0].author_name == "Unknown"
+        assert posts[0].timestamp is None
+        assert (posts[0].likes, posts[0].comments, posts[0].shares) == (0, 0, 0)
+
+    def test_parse_item_builds_single_line_title(self):
+        post = _parse_linkedin_item(_item("Big news\r\nCMMC\tlevel 2 " + "x" * 100, LAST_FETCHED_TS))
+
+        assert post.title.startswith("Big news  CMMC level 2 ")
+        assert post.title.endswith("...")
+        assert post.author_name == "Katie Arrington"
+        assert (post.likes, post.comments, post.shares) == (10, 2, 1)
+
+
+class TestSaveLastFetched:
+    """Test atomic last-fetched persistence."""
+
+    def test_interrupted_dump_keeps_previous_file(self, last_fetched_file):
+        fetch_linkedin_posts._save_last_fetched({"last_fetched_ts": 1, "bad": object()})
+
+        assert json.loads(last_fetched_file.read_text()) == {"last_fetched_ts": LAST_FETCHED_TS}
+        assert list(last_fetched_file.parent.glob("*.tmp")) == []
+
+    def test_failed_replace_keeps_previous_file(self, monkeypatch, last_fetched_file):
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(fetch_linkedin_posts.os, "replace", fail_replace)
+
+        fetch_linkedin_posts._save_last_fetched({"last_fetched_ts": 1})
+
+        assert json.loads(last_fetched_file.read_text()) == {"last_fetched_ts": LAST_FETCHED_TS}
+        assert list(last_fetched_file.parent.glob("*.tmp")) == []
+
+
+class TestGetProfileUsername:
+    """Test LinkedIn profile URL parsing."""
+
+    @pytest.mark.parametrize(
+        "profile_url",
+        [
+            "https://www.linkedin.com/in/katie-arrington-a6949425",
+            "https://www.linkedin.com/in/katie-arrington-a6949425/",
+            "https://www.linkedin.com/in/katie-arrington-a6949425/?trk=public_profile",
+            "https://linkedin.com/in/katie-arrington-a6949425?originalSubdomain=us",
+            "linkedin.com/in/katie-arrington-a6949425",
+            "www.linkedin.com/in/katie-arrington-a6949425/",
+            "https://www.linkedin.com/in/katie-arrington-a6949425#recent-activity",
+        ],
+    )
+    def test_extracts_username(self, profile_url):
+        assert _get_profile_username(profile_url) == "katie-arrington-a6949425"
+
+    def test_returns_input_for_non_profile_url(self):
+        assert _get_profile_username("katie-arrington-a6949425") == "katie-arrington-a6949425"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
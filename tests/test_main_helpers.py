@@ -12,7 +12,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 from dataclasses import dataclass
 
 import pytest
-from main import _load_json_dict, _safe_write_json, _to_dict, _to_dict_list
+from main import _load_json_dict, _safe_write_json, _safe_write_text, _to_dict, _to_dict_list
 
 
 @dataclass
@@ -431,5 +431,18 @@ class TestSafeWriteJson:
         assert "\n" in content  # pretty-printed
 
 
+class TestSafeWriteText:
+    """Test _safe_write_text atomic write helper."""
+
+    def test_replaces_existing_file(self, tmp_path):
+        path = tmp_path / "index.html"
+        path.write_text("<html>old</html>")
+
+        _safe_write_text(path, "<html>new – ünïcode</html>")
+
+        assert path.read_text(encoding="utf-8") == "<html>new – ünïcode</html>"
+        assert list(tmp_path.glob("*.tmp")) == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -65,6 +65,86 @@ class TestPipeline:
         pipeline = CMMCWatchPipeline()
         assert pipeline._validate_environment() is True
 
+    def test_run_overlaps_image_fetch_and_output_steps(self, monkeypatch, tmp_path):
+        """Test run() fetches images alongside design/editorial and writes all outputs."""
+        import threading
+
+        import main
+
+        monkeypatch.setenv("GROQ_API_KEY", "test_key")
+        pipeline = CMMCWatchPipeline(project_root=tmp_path)
+
+        design_started = threading.Event()
+        calls = []
+
+        def fetch_images(keywords):
+            # Only completes if the design step runs while images are being fetched
+            assert design_started.wait(timeout=5)
+            return [{"url": f"https://img.example/{kw}.jpg"} for kw in keywords]
+
+        def generate_design():
+            design_started.set()
+            return {"theme_name": "test"}
+
+        monkeypatch.setattr(pipeline.trend_collector, "collect_all", lambda: [{"title": str(i)} for i in range(3)])
+        monkeypatch.setattr(pipeline.trend_collector, "get_global_keywords", lambda: ["cmmc", "nist"])
+        monkeypatch.setattr(pipeline.image_fetcher, "fetch_for_keywords", fetch_images)
+        monkeypatch.setattr(pipeline, "_generate_design", generate_design)
+        monkeypatch.setattr(pipeline, "_generate_editorial", lambda: calls.append("editorial"))
+        monkeypatch.setattr(pipeline, "_build_website", lambda: calls.append("website"))
+        monkeypatch.setattr(pipeline, "_generate_rss", lambda: calls.append("rss"))
+        monkeypatch.setattr(main, "save_pwa_assets", lambda public_dir: calls.append("pwa"))
+        monkeypatch.setattr(main, "save_sitemap", lambda public_dir, base_url: calls.append("sitemap"))
+        monkeypatch.setattr(pipeline.archive_manager, "cleanup_old", lambda: 0)
+
+        assert pipeline.run(archive=False) is True
+        assert len(pipeline.images) == 2
+        assert calls[:2] == ["editorial", "website"]
+        assert sorted(calls[2:]) == ["pwa", "rss", "sitemap"]
+        assert (tmp_path / "data" / "images.json").exists()
+
+    def test_generate_design_reuses_design_read_for_archive(self, monkeypatch, tmp_path):
+        """Test _generate_design reuses today's design loaded in step 1 without re-reading it."""
+        from datetime import datetime
+
+        import main
+
+        pipeline = CMMCWatchPipeline(project_root=tmp_path)
+        pipeline.saved_design = {"design_seed": datetime.now().strftime("%Y-%m-%d"), "theme_name": "saved"}
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("design.json should not be re-read")
+
+        monkeypatch.setattr(main, "_load_json_dict", fail_load)
+
+        assert pipeline._generate_design() is pipeline.saved_design
+
+    def test_build_website_keeps_cached_trend_dicts_unannotated(self, monkeypatch, tmp_path):
+        """Test _build_website hands the builder copies of the cached trend dicts."""
+        import build_website
+
+        built = {}
+
+        class FakeBuilder:
+            def __init__(self, context):
+                built["context"] = context
+
+            def build(self):
+                built["context"].trends[0]["time_ago"] = "Just now"
+                return "<html></html>"
+
+        monkeypatch.setattr(build_website, "WebsiteBuilder", FakeBuilder)
+
+        pipeline = CMMCWatchPipeline(project_root=tmp_path)
+        pipeline.trend_dicts = [{"title": "Story"}]
+        pipeline.image_dicts = [{"id": "img"}]
+        pipeline.design = {}
+        pipeline._build_website()
+
+        assert pipeline.trend_dicts == [{"title": "Story"}]
+        assert built["context"].images is pipeline.image_dicts
+        assert (tmp_path / "public" / "index.html").read_text() == "<html></html>"
+
 
 class TestPipelineIntegration:
     """Integration tests for pipeline (slow, requires API keys)."""
@@ -3,18 +3,22 @@
 
 from __future__ import annotations
 
+import io
 import sys
 import time
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import feedparser
 import pytest
 import requests
 
 # Add scripts to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
+import collect_trends
+import feed_parsing
 from collect_trends import Trend, TrendCollector
 
 
@@ -27,6 +31,13 @@ def _mock_response(url: str, status: int, content: bytes, content_type: str):
     return response
 
 
+class _UnclosableStream(io.BytesIO):
+    """Byte stream whose read position stays inspectable after the response closes it."""
+
+    def close(self):
+        pass
+
+
 class TestTrendCollector:
     """Test TrendCollector functionality."""
 
@@ -80,6 +91,28 @@ class TestTrendCollector:
         assert score1 > score2
         assert score1 <= 3.0
 
+    @pytest.mark.parametrize(
+        ("title", "description", "expected"),
+        [
+            # Two core CMMC hits (cmmc, cmmc certification) + one NIST hit (nist 800-171)
+            (
+                "CMMC certification for defense contractors",
+                "NIST 800-171 compliance required",
+                (True, "cmmc_program", 1.8),
+            ),
+            ("FedRAMP authorization update", "New baseline published", (True, "nist_compliance", 1.2)),
+            ("Chinese espionage campaign targets contractors", "", (True, "intelligence_threats", 1.0)),
+            # Insider threats outrank the defense contractor (DIB) match
+            ("Insider threat case at defense contractor", "", (True, "insider_threats", 1.0)),
+            ("Quarterly earnings call recap", "Stock rose", (False, "federal_cybersecurity", 1.0)),
+        ],
+    )
+    def test_analyze_returns_expected_relevance(self, title, description, expected):
+        collector = TrendCollector()
+        is_cmmc, category, score = collector._analyze(title, description)
+        assert (is_cmmc, category) == expected[:2]
+        assert score == pytest.approx(expected[2])
+
     def test_clean_html(self):
         collector = TrendCollector()
         clean = collector._clean_html("<p>This is <strong>bold</strong> text</p>")
@@ -87,6 +120,11 @@ class TestTrendCollector:
         assert "bold" in clean
         assert collector._clean_html("This is plain text") == "This is plain text"
 
+    def test_clean_html_separates_blocks_and_drops_scripts(self):
+        collector = TrendCollector()
+        clean = collector._clean_html("<p>First</p><p>Second &amp; third</p><script>track()</script>")
+        assert clean == "First Second & third"
+
     def test_is_valid_image_url(self):
         collector = TrendCollector()
         assert collector._is_valid_image_url("https://example.com/image.jpg")
@@ -96,6 +134,65 @@ class TestTrendCollector:
         assert not collector._is_valid_image_url("http://example.com/1x1.gif")
         assert not collector._is_valid_image_url("")
 
+    def test_extract_image_from_entry_reads_feed_fields(self):
+        collector = TrendCollector()
+        feed = feedparser.parse(
+            b"""<rss xmlns:media="http://search.yahoo.com/mrss/"><channel><item>
+            <title>CMMC story</title>
+            <media:thumbnail url="https://example.com/tracking.png"/>
+            <enclosure url="https://cdn.example.com/story.jpg" type="image/jpeg"/>
+            </item></channel></rss>"""
+        )
+        entry = feed.entries[0]
+        assert collector._extract_image_from_entry(entry) == "https://cdn.example.com/story.jpg"
+
+    def test_parse_feed_entries_reads_rss_items_like_feedparser(self):
+        collector = TrendCollector()
+        content = b"""<?xml version="1.0"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/">
+  <channel>
+    <item>
+      <title>DoD &amp;amp; Cyber-AB update CMMC assessment guide</title>
+      <link>https://fedscoop.com/cmmc-guide</link>
+      <description><![CDATA[<p>Assessors get new <b>guidance</b>.</p>]]></description>
+      <pubDate>Tue, 02 Jan 2024 03:04:05 -0500</pubDate>
+      <media:content url="https://cdn.fedscoop.com/guide.jpg" medium="image" />
+    </item>
+    <item>
+      <title>Second story</title>
+      <guid isPermaLink="true">https://fedscoop.com/second</guid>
+    </item>
+  </channel>
+</rss>"""
+
+        entries = feed_parsing.parse_feed_entries(content, 1)
+        reference = feedparser.parse(content).entries[0]
+
+        assert len(entries) == 1
+        entry = entries[0]
+        assert entry["title"] == "DoD & Cyber-AB update CMMC assessment guide"
+        assert entry["link"] == reference.link
+        assert collector._clean_html(entry["summary"]) == collector._clean_html(reference.summary)
+        assert feed_parsing.parse_feed_entry_timestamp(entry) == feed_parsing.parse_feed_entry_timestamp(reference)
+        assert collector._extract_image_from_entry(entry) == "https://cdn.fedscoop.com/guide.jpg"
+        assert feed_parsing.parse_feed_entries(content, 5)[1]["link"] == "https://fedscoop.com/second"
+
+    def test_parse_feed_entries_falls_back_to_feedparser_for_atom(self):
+        content = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <title>CMMC Level 2 assessment questions</title>
+    <link href="https://www.reddit.com/r/CMMC/comments/abc/" />
+    <updated>2024-01-02T03:04:05Z</updated>
+  </entry>
+</feed>"""
+
+        entries = feed_parsing.parse_feed_entries(content, 15)
+
+        assert feed_parsing._parse_rss_items(content, 15) is None
+        assert entries[0].get("link") == "https://www.reddit.com/r/CMMC/comments/abc/"
+
     def test_trend_dataclass_enriches_source_metadata(self):
         trend = Trend(
             title="NIST update",
@@ -156,6 +253,157 @@ class TestTrendCollector:
         assert response is not None
         assert b"cached" in response.content
 
+    def test_collect_feeds_preserves_source_order(self):
+        collector = TrendCollector()
+        sources = collector._collector_sources("cmmc_rss")[:3]
+        feeds = {
+            source.url: _mock_response(
+                source.url,
+                200,
+                f"<rss><channel><item><title>CMMC assessment news from {source.key}</title>"
+                f"<link>https://example.com/{source.key}</link></item></channel></rss>".encode(),
+                "application/rss+xml",
+            )
+            for source in sources
+        }
+        collector._collector_sources = MagicMock(side_effect=lambda group: sources if group == "cmmc_rss" else [])
+        collector._fetch_rss = MagicMock(side_effect=lambda url, **_kwargs: feeds[url])
+
+        collector._collect_feeds()
+
+        assert [t.source for t in collector.trends] == [s.source_key or s.key for s in sources]
+        assert collector._fetch_rss.call_count == len(sources)
+
+    def test_fetch_missing_images_assigns_results_to_matching_trends(self):
+        collector = TrendCollector()
+        collector.trends = [
+            Trend(title="FedScoop CMMC story", source="cmmc_fedscoop", url="https://example.com/a"),
+            Trend(title="Reddit CMMC thread", source="cmmc_reddit_cmmc", url="https://example.com/b"),
+            Trend(title="CyberScoop CMMC story", source="cmmc_cyberscoop", url="https://example.com/c"),
+        ]
+        images = {
+            "https://example.com/a": "https://cdn.example.com/a.jpg",
+            "https://example.com/c": None,
+        }
+        collector._fetch_og_image = MagicMock(side_effect=lambda url: images[url])
+
+        collector._fetch_missing_images()
+
+        assert collector.trends[0].image_url == "https://cdn.example.com/a.jpg"
+        assert collector.trends[1].image_url is None
+        assert collector.trends[2].image_url is None
+        assert collector._fetch_og_image.call_count == 2
+
+    def test_fetch_rss_reuses_cached_body_on_not_modified(self):
+        collector = TrendCollector()
+        scope = "cmmc_fedscoop_test"
+        url = "https://fedscoop.com/feed/"
+        cached_response = _mock_response(
+            url,
+            200,
+            b"<rss><channel><item><title>unchanged</title></item></channel></rss>",
+            "application/rss+xml",
+        )
+        cached_response.headers["ETag"] = '"abc123"'
+        cached_response.headers["Last-Modified"] = "Wed, 14 Oct 2026 10:00:00 GMT"
+        collector._cache_feed_response(scope, cached_response, url)
+        collector.session.get = MagicMock(return_value=_mock_response(url, 304, b"", "application/rss+xml"))
+
+        response = collector._fetch_rss(url, source_key=scope)
+
+        sent_headers = collector.session.get.call_args.kwargs["headers"]
+        assert sent_headers["If-None-Match"] == '"abc123"'
+        assert sent_headers["If-Modified-Since"] == "Wed, 14 Oct 2026 10:00:00 GMT"
+        assert response is not None
+        assert response.status_code == 200
+        assert b"unchanged" in response.content
+
+    def test_persistent_feed_cache_round_trips_through_disk(self, tmp_path):
+        collector = TrendCollector()
+        collector.feed_cache_file = tmp_path / "feed_runtime_cache.json"
+        collector.persistent_feed_cache = {}
+        url = "https://fedscoop.com/feed/"
+        body = b"<rss><channel><item><title>persisted</title></item></channel></rss>"
+        collector._cache_feed_response("cmmc_fedscoop", _mock_response(url, 200, body, "application/rss+xml"), url)
+
+        collector._flush_persistent_feed_cache()
+
+        reloaded = TrendCollector()
+        reloaded.feed_cache_file = collector.feed_cache_file
+        reloaded._load_persistent_feed_cache()
+        response = reloaded._get_cached_feed_response("cmmc_fedscoop")
+        assert response is not None
+        assert response.content == body
+
+    def test_fetch_og_image_stops_reading_after_head(self):
+        collector = TrendCollector()
+        url = "https://fedscoop.com/story"
+        page = (
+            b'<html><head><meta property="og:image" content="https://cdn.example.com/story.jpg">'
+            b"</head><body>" + b"x" * 500_000 + b"</body></html>"
+        )
+        response = _mock_response(url, 200, b"", "text/html")
+        response.raw = _UnclosableStream(page)
+        response._content_consumed = False
+        response._content = False
+        collector.session.get = MagicMock(return_value=response)
+
+        assert collector._fetch_og_image(url) == "https://cdn.example.com/story.jpg"
+        assert collector.session.get.call_args.kwargs["stream"] is True
+        assert response.raw.tell() < len(page)
+
+    def test_fetch_og_image_returns_once_tag_is_seen(self):
+        collector = TrendCollector()
+        url = "https://fedscoop.com/story"
+        page = b'<html><head><meta content="https://cdn.example.com/lead.png" property="og:image">' + b"x" * 200_000
+        response = _mock_response(url, 200, b"", "text/html")
+        response.raw = _UnclosableStream(page)
+        response._content_consumed = False
+        response._content = False
+        collector.session.get = MagicMock(return_value=response)
+
+        assert collector._fetch_og_image(url) == "https://cdn.example.com/lead.png"
+        assert response.raw.tell() <= 8192
+
+    def test_fetch_og_image_waits_for_url_split_across_chunks(self):
+        collector = TrendCollector()
+        url = "https://fedscoop.com/story"
+        image_url = "https://cdn.fedscoop.com/wp-content/uploads/2026/01/lead.png"
+        tag = f'<meta property="og:image" content="{image_url}">'.encode()
+        # Pad so the first chunk ends partway through the image URL
+        prefix = b"<html><head>" + b" " * (8192 - len("<html><head>") - tag.index(b"/upl") - 4)
+        page = prefix + tag + b"</head><body>" + b"x" * 20_000
+        response = _mock_response(url, 200, b"", "text/html")
+        response.raw = _UnclosableStream(page)
+        response._content_consumed = False
+        response._content = False
+        collector.session.get = MagicMock(return_value=response)
+
+        assert page[:8192].endswith(b"/upl")
+        assert collector._fetch_og_image(url) == image_url
+
+    def test_host_slot_is_shared_per_hostname(self):
+        collector = TrendCollector()
+        slot = collector._host_slot("https://www.reddit.com/r/CMMC/.rss")
+
+        assert collector._host_slot("https://www.reddit.com/r/NISTControls/.rss") is slot
+        assert collector._host_slot("https://fedscoop.com/feed/") is not slot
+
+    def test_host_request_paces_reddit_one_at_a_time(self, monkeypatch):
+        collector = TrendCollector()
+        sleeps = []
+        monkeypatch.setattr(collect_trends.time, "sleep", sleeps.append)
+
+        with collector._host_request("https://www.reddit.com/r/CMMC/.rss"):
+            assert not collector._host_slot("https://www.reddit.com/r/NISTControls/.rss").acquire(blocking=False)
+        assert sleeps == [collector.request_delay]
+
+        with collector._host_request("https://fedscoop.com/feed/"):
+            slot = collector._host_slot("https://fedscoop.com/other/")
+            assert slot.acquire(blocking=False)
+            slot.release()
+        assert sleeps == [collector.request_delay]
+
     def test_deduplicate_merges_corroborating_sources(self):
         collector = TrendCollector()
         collector.trends = [
@@ -187,6 +435,77 @@ class TestTrendCollector:
         assert "cmmc_nist_csrc" in merged.corroborating_sources
         assert "cmmc_fedscoop" in merged.corroborating_sources
 
+    def test_deduplicate_merges_exact_title_reposts(self):
+        collector = TrendCollector()
+        collector.trends = [
+            Trend(title="CMMC Phase 2 begins!", source="cmmc_fedscoop", url="https://example.com/1"),
+            Trend(title="Unrelated DFARS clause story", source="cmmc_nist_csrc", url="https://example.com/2"),
+            Trend(title="cmmc phase 2 begins", source="cmmc_defensescoop", url="https://example.com/3"),
+        ]
+
+        collector._deduplicate()
+
+        assert len(collector.trends) == 2
+        merged = next(t for t in collector.trends if "phase" in t.title.lower())
+        assert set(merged.corroborating_sources) == {"cmmc_fedscoop", "cmmc_defensescoop"}
+
+    def test_extract_global_keywords_orders_by_frequency(self):
+        collector = TrendCollector()
+        collector.trends = [
+            Trend(title="Pentagon finalizes CMMC rule", source="cmmc_fedscoop"),
+            Trend(title="CMMC rule enforcement begins", source="cmmc_defensescoop"),
+            Trend(title="What the CMMC rule means", source="cmmc_reddit_cmmc"),
+        ]
+
+        collector._extract_global_keywords()
+
+        assert collector.global_keywords[:2] == ["cmmc", "rule"]
+        assert "what" not in collector.global_keywords
+        assert "pentagon" in collector.global_keywords
+
+    @pytest.mark.parametrize("use_rapidfuzz", [True, False])
+    def test_deduplicate_fuzzy_titles_with_either_matcher(self, monkeypatch, use_rapidfuzz):
+        if use_rapidfuzz:
+            pytest.importorskip("rapidfuzz")
+        else:
+            monkeypatch.setattr(collect_trends, "_fuzz_ratio", None)
+        collector = TrendCollector()
+        collector.trends = [
+            # Inflected variants share almost no exact tokens, so only character similarity merges them
+            Trend(title="Contractor compliance deadline extended", source="cmmc_fedscoop"),
+            Trend(title="Contractors compliance deadlines extend", source="cmmc_defensescoop"),
+            Trend(title="FedRAMP marketplace adds cloud vendors", source="cmmc_nist_csrc"),
+        ]
+
+        collector._deduplicate()
+
+        assert len(collector.trends) == 2
+
+    def test_ai_validate_keeps_trend_objects_and_applies_categories(self, monkeypatch):
+        collector = TrendCollector()
+        kept = Trend(
+            title="DoD finalizes CMMC acquisition rule",
+            source="cmmc_fedscoop",
+            url="https://fedscoop.com/cmmc-rule",
+            corroborating_sources=["cmmc_fedscoop", "cmmc_nextgov"],
+        )
+        dropped = Trend(title="Unrelated sports story of the week", source="cmmc_cyberpress")
+        collector.trends = [kept, dropped]
+
+        class _FakeValidator:
+            def validate_stories(self, stories, use_ai=True):
+                stories[0]["category"] = "cmmc_program"
+                return [stories[0]], [dict(stories[1], rejection_reason="irrelevant")]
+
+        monkeypatch.setattr(collect_trends, "StoryValidator", _FakeValidator)
+
+        collector._ai_validate()
+
+        assert collector.trends == [kept]
+        assert collector.trends[0] is kept
+        assert kept.category == "cmmc_program"
+        assert kept.corroborating_sources == ["cmmc_fedscoop", "cmmc_nextgov"]
+
     def test_apply_recency_and_sort_uses_source_quality(self):
         collector = TrendCollector()
         now = datetime.now()
@@ -207,6 +526,31 @@ class TestTrendCollector:
         collector._apply_recency_and_sort()
         assert collector.trends[0].source == "cmmc_nist_csrc"
 
+    def test_apply_recency_and_sort_measures_age_in_utc(self, monkeypatch):
+        if not hasattr(time, "tzset"):
+            pytest.skip("time.tzset is unavailable on this platform")
+        # A local clock ahead of UTC must not make fresh feed timestamps look hours old
+        monkeypatch.setenv("TZ", "Asia/Tokyo")
+        time.tzset()
+        try:
+            collector = TrendCollector()
+            collector.trends = [
+                Trend(
+                    title="Fresh CMMC rule published",
+                    source="cmmc_nist_csrc",
+                    score=1.0,
+                    timestamp=datetime.now(timezone.utc) - timedelta(hours=1),
+                ),
+            ]
+
+            collector._apply_recency_and_sort()
+
+            baseline = collect_trends.source_quality_multiplier("cmmc_nist_csrc")
+            assert collector.trends[0].score == pytest.approx(baseline + 2.0)
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])